@@ -1,8 +1,34 @@
+import itertools
+import json
+import os
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, fields
+from functools import cache, partial
+from types import MappingProxyType
 from pathlib import Path
 ROOT = Path(__file__).parent.parent
+ROOT_STR = os.fspath(ROOT)
 
-doe_twolocal_common = {
-    'lp_file': f'{ROOT}/data/1/31bonds/docplex-bin-avgonly.lp',
+LP_31 = os.path.join(ROOT_STR, 'data', '1', '31bonds', 'docplex-bin-avgonly.lp')
+LP_109 = os.path.join(ROOT_STR, 'data', '1', '109bonds', 'docplex-bin-avgonly.lp')
+LP_155 = os.path.join(ROOT_STR, 'data', '1', '155bonds', 'docplex-bin-avgonly.lp')
+LP_VG_MV_31 = os.path.join(ROOT_STR, 'vanguard_problems', 'mean_variance_31assets_normal_risk1.0.lp')
+LP_VG_ESG_31 = os.path.join(ROOT_STR, 'vanguard_problems', 'esg_constrained_31assets_esg7.0.lp')
+LP_VG_IT_31 = os.path.join(ROOT_STR, 'vanguard_problems', 'index_tracking_31assets_te0.02.lp')
+LP_VG_WORKING = os.path.join(ROOT_STR, 'vanguard_problems', 'working_portfolio.lp')
+LP_CONV_ESG_31 = os.path.join(ROOT_STR, 'converted_problems', 'esg_constrained_31assets_esg7.0.lp')
+LP_CONV_MV_31 = os.path.join(ROOT_STR, 'converted_problems', 'mean_variance_31assets_normal_risk1.0_converted.lp')
+LP_CONV_IT_31 = os.path.join(ROOT_STR, 'converted_problems', 'index_tracking_31assets_te0.02.lp')
+LP_CONV_MANUAL = os.path.join(ROOT_STR, 'converted_problems', 'manual_portfolio.lp')
+LP_CONV_MV_109 = os.path.join(ROOT_STR, 'converted_problems', 'mean_variance_109assets_normal_risk1.0.lp')
+LP_CONV_MV_109_CONVERTED = os.path.join(ROOT_STR, 'converted_problems', 'mean_variance_109assets_normal_risk1.0_converted.lp')
+
+# shared ansatz_params, one dict per (reps, entanglement) combination
+_AP = {(reps, entanglement): {'reps': reps, 'entanglement': entanglement}
+       for reps in (1, 2, 3) for entanglement in ('full', 'bilinear', 'color')}
+
+doe_twolocal_common = MappingProxyType({
+    'lp_file': LP_31,
     'num_exec': 10,
     'ansatz': 'TwoLocal',
     'theta_initial': 'piby3',
@@ -11,10 +37,10 @@ doe_twolocal_common = {
     'max_epoch': 4,
     'shots': 2**13,
     'theta_threshold': 0.,
-    }
+    })
 
-doe_bfcd_common = {
-    'lp_file': f'{ROOT}/data/1/31bonds/docplex-bin-avgonly.lp',
+doe_bfcd_common = MappingProxyType({
+    'lp_file': LP_31,
     'num_exec': 10,
     'ansatz': 'bfcd',
     'theta_initial': 'piby3',
@@ -23,10 +49,10 @@ doe_bfcd_common = {
     'max_epoch': 4,
     'shots': 2**13,
     'theta_threshold': 0.,
-    }
+    })
 
-doe_bfcdR_common = {
-    'lp_file': f'{ROOT}/data/1/31bonds/docplex-bin-avgonly.lp',
+doe_bfcdR_common = MappingProxyType({
+    'lp_file': LP_31,
     'num_exec': 10,
     'ansatz': 'bfcdR',
     'theta_initial': 'piby3',
@@ -35,421 +61,306 @@ doe_bfcdR_common = {
     'max_epoch': 4,
     'shots': 2**13,
     'theta_threshold': 0.,
-    }
+    })
 
-doe_109qubits_common = {
-    'lp_file': f'{ROOT}/data/1/109bonds/docplex-bin-avgonly.lp',
-}
+doe_109qubits_common = MappingProxyType({
+    'lp_file': LP_109,
+})
 
-doe_155qubits_common = {
-    'lp_file': f'{ROOT}/data/1/155bonds/docplex-bin-avgonly.lp',
-}
+doe_155qubits_common = MappingProxyType({
+    'lp_file': LP_155,
+})
 
-doe_hw_common = {
+doe_hw_common = MappingProxyType({
     'num_exec': 1,
     'theta_threshold': .06,
-}
-
-doe = {
-    # TwoLocal full entanglement
-    '1/31bonds/TwoLocal1repFull_piby3_AerSimulator_0.1':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal1repFull_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 1, 'entanglement': 'full'},
-            'alpha': 0.1,
-            },
-    '1/31bonds/TwoLocal2repFull_piby3_AerSimulator_0.1':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal2repFull_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 2, 'entanglement': 'full'},
-            'alpha': 0.1,
-            },
-    '1/31bonds/TwoLocal3repFull_piby3_AerSimulator_0.1':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal3repFull_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 3, 'entanglement': 'full'},
-            'alpha': 0.1,
-            },
-    '1/31bonds/TwoLocal3repFull_piby3_AerSimulator_0.15':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal3repFull_piby3_AerSimulator_0.15',
-            'ansatz_params': {'reps': 3, 'entanglement': 'full'},
-            'alpha': 0.15,
-            },
-    '1/31bonds/TwoLocal3repFull_piby3_AerSimulator_0.2':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal3repFull_piby3_AerSimulator_0.2',
-            'ansatz_params': {'reps': 3, 'entanglement': 'full'},
-            'alpha': 0.2,
-            },
-    # Twolocal bilinear entanglement
-    '1/31bonds/TwoLocal1rep_piby3_AerSimulator_0.1':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal1rep_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            },
-    '1/31bonds/TwoLocal1rep_piby3_AerSimulator_0.15':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal1rep_piby3_AerSimulator_0.15',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'alpha': 0.15,
-            },
-    '1/31bonds/TwoLocal1rep_piby3_AerSimulator_0.2':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal1rep_piby3_AerSimulator_0.2',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'alpha': 0.2,
-            },
-    '1/31bonds/TwoLocal2rep_piby3_AerSimulator_0.1':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal2rep_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 2, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            },
-    '1/31bonds/TwoLocal2rep_piby3_AerSimulator_0.15':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal2rep_piby3_AerSimulator_0.15',
-            'ansatz_params': {'reps': 2, 'entanglement': 'bilinear'},
-            'alpha': 0.15,
-            },
-    '1/31bonds/TwoLocal2rep_piby3_AerSimulator_0.2':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal2rep_piby3_AerSimulator_0.2',
-            'ansatz_params': {'reps': 2, 'entanglement': 'bilinear'},
-            'alpha': 0.2,
-            },
-    '1/31bonds/TwoLocal3rep_piby3_AerSimulator_0.1':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal3rep_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 3, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            },
-    '1/31bonds/TwoLocal3rep_piby3_AerSimulator_0.15':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal3rep_piby3_AerSimulator_0.15',
-            'ansatz_params': {'reps': 3, 'entanglement': 'bilinear'},
-            'alpha': 0.15,
-            },
-    '1/31bonds/TwoLocal3rep_piby3_AerSimulator_0.2':
-        doe_twolocal_common | {
-            'experiment_id': 'TwoLocal3rep_piby3_AerSimulator_0.2',
-            'ansatz_params': {'reps': 3, 'entanglement': 'bilinear'},
-            'alpha': 0.2,
-            },
-    
-    # BFCD
-    '1/31bonds/bfcd1rep_piby3_AerSimulator_0.1':
-        doe_bfcd_common | {
-            'experiment_id': 'bfcd1rep_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            },
-    '1/31bonds/bfcd2rep_piby3_AerSimulator_0.1':
-        doe_bfcd_common | {
-            'experiment_id': 'bfcd2rep_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 2, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            },
-    '1/31bonds/bfcd3rep_piby3_AerSimulator_0.1':
-        doe_bfcd_common | {
-            'experiment_id': 'bfcd3rep_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 3, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            },
-    '1/31bonds/bfcd1rep_piby3_AerSimulator_0.15':
-        doe_bfcd_common | {
-            'experiment_id': 'bfcd1rep_piby3_AerSimulator_0.15',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'alpha': 0.15,
-            },
-    '1/31bonds/bfcd2rep_piby3_AerSimulator_0.15':
-        doe_bfcd_common | {
-            'experiment_id': 'bfcd2rep_piby3_AerSimulator_0.15',
-            'ansatz_params': {'reps': 2, 'entanglement': 'bilinear'},
-            'alpha': 0.15,
-            },
-    '1/31bonds/bfcd3rep_piby3_AerSimulator_0.15':
-        doe_bfcd_common | {
-            'experiment_id': 'bfcd3rep_piby3_AerSimulator_0.15',
-            'ansatz_params': {'reps': 3, 'entanglement': 'bilinear'},
-            'alpha': 0.15,
-            },
-    '1/31bonds/bfcd1rep_piby3_AerSimulator_0.2':
-        doe_bfcd_common | {
-            'experiment_id': 'bfcd1rep_piby3_AerSimulator_0.2',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'alpha': 0.2,
-            },
-    '1/31bonds/bfcd2rep_piby3_AerSimulator_0.2':
-        doe_bfcd_common | {
-            'experiment_id': 'bfcd2rep_piby3_AerSimulator_0.2',
-            'ansatz_params': {'reps': 2, 'entanglement': 'bilinear'},
-            'alpha': 0.2,
-            },
-    '1/31bonds/bfcd3rep_piby3_AerSimulator_0.2':
-        doe_bfcd_common | {
-            'experiment_id': 'bfcd3rep_piby3_AerSimulator_0.2',
-            'ansatz_params': {'reps': 3, 'entanglement': 'bilinear'},
-            'alpha': 0.2,
-            },
-
-    # Hardware
-    '1/31bonds/TwoLocal2rep_piby3_kyiv_0.15': # remark: the one that's run had no theta_threshold
-        doe_twolocal_common | doe_hw_common | {
-            'device':'ibm_kyiv',
-            'experiment_id': 'TwoLocal2rep_piby3_kyiv_0.15',
-            'ansatz_params': {'reps': 2, 'entanglement': 'bilinear'},
-            'alpha': 0.15,
-            },
-    '1/31bonds/TwoLocal2rep_piby3_kyiv_0.1':
-        doe_twolocal_common | doe_hw_common | {
-            'device':'ibm_kyiv',
-            'experiment_id': 'TwoLocal2rep_piby3_kyiv_0.1',
-            'ansatz_params': {'reps': 2, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            },
-
-    # 109 QUBITS
-    # Twolocal bilinear entanglement
-    '1/109bonds/TwoLocal1rep_piby3_AerSimulator_0.1':
-        doe_twolocal_common | doe_109qubits_common | {
-            'experiment_id': 'TwoLocal1rep_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            },
-    '1/109bonds/TwoLocal2rep_piby3_AerSimulator_0.1':
-        doe_twolocal_common | doe_109qubits_common | {
-            'experiment_id': 'TwoLocal2rep_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 2, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            },
-
-    # Hardware
-    '1/109bonds/TwoLocal2rep_color_piby3_marrakersh_0.1':
-        doe_twolocal_common | doe_109qubits_common | doe_hw_common | {
-            'device':'ibm_marrakesh',
-            'experiment_id': 'TwoLocal2rep_color_piby3_marrakesh_0.1',
-            'ansatz_params': {'reps': 2, 'entanglement': 'color'},
-            'alpha': 0.1,
-            'max_epoch': 1,
-            },
-    '1/109bonds/TwoLocal2rep_color_piby3_fez_0.1':
-        doe_twolocal_common | doe_109qubits_common | doe_hw_common | {
-            'device':'ibm_fez',
-            'experiment_id': 'TwoLocal2rep_color_piby3_fez_0.1',
-            'ansatz_params': {'reps': 2, 'entanglement': 'color'},
-            'alpha': 0.1,
-            'max_epoch': 1,
-            },
-    '1/109bonds/TwoLocal2rep_bilinear_piby3_fez_0.1':
-        doe_twolocal_common | doe_109qubits_common | doe_hw_common | {
-            'device':'ibm_fez',
-            'experiment_id': 'TwoLocal2rep_bilinear_piby3_fez_0.1',
-            'ansatz_params': {'reps': 2, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            'max_epoch': 1,
-            },
-    '1/109bonds/bfcdR2rep_color_piby3_marrakesh_0.1':
-        doe_bfcdR_common | doe_109qubits_common | doe_hw_common | {
-            'device':'ibm_marrakesh',
-            'experiment_id': 'bfcdR2rep_color_piby3_marrakesh_0.1',
-            'ansatz_params': {'reps': 2, 'entanglement': 'color'},
-            'alpha': 0.1,
-            'max_epoch': 2,
-            },
-
-    # 155 QUBITS
-    # Twolocal bilinear entanglement
-    '1/155bonds/TwoLocal2rep_piby3_AerSimulator_0.1':
-        doe_twolocal_common | doe_155qubits_common | {
-            'experiment_id': 'TwoLocal2rep_piby3_AerSimulator_0.1',
-            'ansatz_params': {'reps': 2, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            },
-
-    ############ TEST ############
-    '1/31bonds/test':
-        doe_twolocal_common | {
-            'experiment_id': 'test',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'alpha': 0.1,
-            'theta_threshold': .06,
-            'num_exec': 1,
-            'max_epoch': 1,
-            },
-        
-    # Custom Portfolio Problems for Vanguard Challenge
-    'custom/mean_variance_31_normal': {
-            'lp_file': f'{ROOT}/vanguard_problems/mean_variance_31assets_normal_risk1.0.lp',
-            'experiment_id': 'mean_variance_31_normal',
-            'num_exec': 1,
-            'ansatz': 'TwoLocal',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'theta_initial': 'piby3',
-            'optimizer': 'nft',
-            'device': 'AerSimulator',
-            'max_epoch': 4,
-            'alpha': 0.1,
-            'shots': 2**13,
-            'theta_threshold': 0.06,
-        },
-
-    'custom/esg_constrained_31': {
-            'lp_file': f'{ROOT}/vanguard_problems/esg_constrained_31assets_esg7.0.lp',
-            'experiment_id': 'esg_constrained_31',
-            'num_exec': 1,
-            'ansatz': 'TwoLocal',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'theta_initial': 'piby3',
-            'optimizer': 'nft',
-            'device': 'AerSimulator',
-            'max_epoch': 4,
-            'alpha': 0.1,
-            'shots': 2**13,
-            'theta_threshold': 0.06,
-        },
-
-    'custom/index_tracking_31': {
-            'lp_file': f'{ROOT}/vanguard_problems/index_tracking_31assets_te0.02.lp',
-            'experiment_id': 'index_tracking_31',
-            'num_exec': 1,
-            'ansatz': 'TwoLocal',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'theta_initial': 'piby3',
-            'optimizer': 'nft',
-            'device': 'AerSimulator',
-            'max_epoch': 4,
-            'alpha': 0.1,
-            'shots': 2**13,
-            'theta_threshold': 0.06,
-        },
-    # Converted Portfolio Problems for VQE
-    'converted/esg_constrained_31assets_esg7.0': {
-            'lp_file': f'{ROOT}/converted_problems/esg_constrained_31assets_esg7.0.lp',
-            'experiment_id': 'converted_esg_constrained_31',
-            'num_exec': 1,
-            'ansatz': 'TwoLocal',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'theta_initial': 'piby3',
-            'optimizer': 'nft',
-            'device': 'AerSimulator',
-            'max_epoch': 4,
-            'alpha': 0.1,
-            'shots': 2**13,
-            'theta_threshold': 0.06,
-        },
-
-    'converted/portfolio_31': {
-            'lp_file': f'{ROOT}/converted_problems/mean_variance_31assets_normal_risk1.0_converted.lp',
-            'experiment_id': 'converted_portfolio_31',
-            'num_exec': 1,
-            'ansatz': 'TwoLocal',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'theta_initial': 'piby3',
-            'optimizer': 'nft',
-            'device': 'AerSimulator',
-            'max_epoch': 4,
-            'alpha': 0.1,
-            'shots': 2**13,
-            'theta_threshold': 0.06,
-        },
-    'manual/portfolio_test': {
-            'lp_file': f'{ROOT}/converted_problems/manual_portfolio.lp',
-            'experiment_id': 'manual_portfolio_test',
-            'num_exec': 1,
-            'ansatz': 'TwoLocal',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'theta_initial': 'piby3',
-            'optimizer': 'nft',
-            'device': 'AerSimulator',
-            'max_epoch': 4,
-            'alpha': 0.1,
-            'shots': 2**13,
-            'theta_threshold': 0.06,
-        },
-    # 'manual/portfolio_test': {
-    #         'lp_file': f'{ROOT}/converted_problems/manual_portfolio.lp',
-    #         'experiment_id': 'manual_portfolio_test',
-    #         'num_exec': 1,
-    #         'ansatz': 'TwoLocal',
-    #         'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-    #         'theta_initial': 'piby3',
-    #         'optimizer': 'nft',
-    #         'device': 'AerSimulator',
-    #         'max_epoch': 1,           # MINIMAL - just 1 epoch
-    #         'alpha': 0.1,
-    #         'shots': 512,             # VERY LOW shots  
-    #         'theta_threshold': 0.06,
-    #     },
-    '109assets/test': {
-            'lp_file': f'{ROOT}/converted_problems/mean_variance_109assets_normal_risk1.0.lp',  # BASE filename - let the code add the suffix
-            'experiment_id': '109assets_normal_risk',
-            'num_exec': 1,
-            'ansatz': 'TwoLocal',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'theta_initial': 'piby3',
-            'optimizer': 'nft',
-            'device': 'AerSimulator',
-            'max_epoch': 200,
-            'alpha': 0.1,
-            'shots': 4096,
-            'theta_threshold': 0.06,
-        },
-    '31assets/generated': {
-            'lp_file': f'{ROOT}/converted_problems/index_tracking_31assets_te0.02.lp',
-            'experiment_id': '31assets_generated_test',
-            'num_exec': 1,
-            'ansatz': 'TwoLocal',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'theta_initial': 'piby3',
-            'optimizer': 'nft',
-            'device': 'AerSimulator',
-            'max_epoch': 4,
-            'alpha': 0.1,
-            'shots': 8192,
-            'theta_threshold': 0.06,
-        },
-    'custom/working_portfolio': {
-            'lp_file': f'{ROOT}/vanguard_problems/working_portfolio.lp',
-            'experiment_id': 'custom_working_portfolio',
-            'num_exec': 1,
-            'ansatz': 'TwoLocal',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'theta_initial': 'piby3',
-            'optimizer': 'nft',
-            'device': 'AerSimulator',
-            'max_epoch': 4,
-            'alpha': 0.1,
-            'shots': 2**13,
-            'theta_threshold': 0.06,
-        },
-    'scale/portfolio_109': {
-            'lp_file': f'{ROOT}/converted_problems/mean_variance_109assets_normal_risk1.0_converted.lp',
-            'experiment_id': 'scale_109_assets',
-            'num_exec': 1,
-            'ansatz': 'TwoLocal',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'theta_initial': 'piby3',
-            'optimizer': 'nft',
-            'device': 'AerSimulator',
-            'max_epoch': 6,  # Increase for larger problem
-            'alpha': 0.1,
-            'shots': 2**13,
-            'theta_threshold': 0.06,
-        },
-    'manual/working_portfolio': {
-            'lp_file': f'{ROOT}/vanguard_problems/working_portfolio.lp',
-            'experiment_id': 'working_portfolio_test',
-            'num_exec': 1,
-            'ansatz': 'TwoLocal',
-            'ansatz_params': {'reps': 1, 'entanglement': 'bilinear'},
-            'theta_initial': 'piby3',
-            'optimizer': 'nft',
-            'device': 'AerSimulator',
-            'max_epoch': 4,
-            'alpha': 0.1,
-            'shots': 2**13,
-            'theta_threshold': 0.06,
-        },
-    }
+})
+
+_PORTFOLIO_DEFAULTS = MappingProxyType({
+    'num_exec': 1,
+    'ansatz': 'TwoLocal',
+    'ansatz_params': _AP[(1, 'bilinear')],
+    'theta_initial': 'piby3',
+    'optimizer': 'nft',
+    'device': 'AerSimulator',
+    'max_epoch': 4,
+    'alpha': 0.1,
+    'shots': 2**13,
+    'theta_threshold': 0.06,
+})
+
+# experiment key -> factory building its configuration, called on first lookup
+_REGISTRY: dict[str, Callable[[], dict]] = {}
+
+
+def register(key: str):
+    """Register the decorated factory as the configuration of experiment `key`."""
+    def deco(fn: Callable[[], dict]) -> Callable[[], dict]:
+        _REGISTRY[key] = fn
+        return fn
+    return deco
+
+
+def _portfolio(lp_file: str, experiment_id: str, **overrides) -> dict:
+    """Single-run TwoLocal experiment on a generated portfolio problem."""
+    return _PORTFOLIO_DEFAULTS | {'lp_file': lp_file, 'experiment_id': experiment_id, **overrides}
+
+
+def _aer_bilinear(common: Mapping, ansatz: str, reps: int, alpha: float) -> dict:
+    """Simulator run of `ansatz` with `reps` bilinear layers on the 31 bonds problem."""
+    return common | {
+        'experiment_id': f'{ansatz}{reps}rep_piby3_AerSimulator_{alpha}',
+        'ansatz_params': _AP[(reps, 'bilinear')],
+        'alpha': alpha,
+        }
+
+
+# TwoLocal full entanglement
+@register('1/31bonds/TwoLocal1repFull_piby3_AerSimulator_0.1')
+def _():
+    return doe_twolocal_common | {
+        'experiment_id': 'TwoLocal1repFull_piby3_AerSimulator_0.1',
+        'ansatz_params': _AP[(1, 'full')],
+        'alpha': 0.1,
+        }
+
+@register('1/31bonds/TwoLocal2repFull_piby3_AerSimulator_0.1')
+def _():
+    return doe_twolocal_common | {
+        'experiment_id': 'TwoLocal2repFull_piby3_AerSimulator_0.1',
+        'ansatz_params': _AP[(2, 'full')],
+        'alpha': 0.1,
+        }
+
+@register('1/31bonds/TwoLocal3repFull_piby3_AerSimulator_0.1')
+def _():
+    return doe_twolocal_common | {
+        'experiment_id': 'TwoLocal3repFull_piby3_AerSimulator_0.1',
+        'ansatz_params': _AP[(3, 'full')],
+        'alpha': 0.1,
+        }
+
+@register('1/31bonds/TwoLocal3repFull_piby3_AerSimulator_0.15')
+def _():
+    return doe_twolocal_common | {
+        'experiment_id': 'TwoLocal3repFull_piby3_AerSimulator_0.15',
+        'ansatz_params': _AP[(3, 'full')],
+        'alpha': 0.15,
+        }
+
+@register('1/31bonds/TwoLocal3repFull_piby3_AerSimulator_0.2')
+def _():
+    return doe_twolocal_common | {
+        'experiment_id': 'TwoLocal3repFull_piby3_AerSimulator_0.2',
+        'ansatz_params': _AP[(3, 'full')],
+        'alpha': 0.2,
+        }
+
+# Twolocal bilinear entanglement
+for reps, alpha in itertools.product((1, 2, 3), (0.1, 0.15, 0.2)):
+    register(f'1/31bonds/TwoLocal{reps}rep_piby3_AerSimulator_{alpha}')(
+        partial(_aer_bilinear, doe_twolocal_common, 'TwoLocal', reps, alpha))
+
+# BFCD
+for alpha, reps in itertools.product((0.1, 0.15, 0.2), (1, 2, 3)):
+    register(f'1/31bonds/bfcd{reps}rep_piby3_AerSimulator_{alpha}')(
+        partial(_aer_bilinear, doe_bfcd_common, 'bfcd', reps, alpha))
+
+# Hardware
+@register('1/31bonds/TwoLocal2rep_piby3_kyiv_0.15')  # remark: the one that's run had no theta_threshold
+def _():
+    return doe_twolocal_common | doe_hw_common | {
+        'device':'ibm_kyiv',
+        'experiment_id': 'TwoLocal2rep_piby3_kyiv_0.15',
+        'ansatz_params': _AP[(2, 'bilinear')],
+        'alpha': 0.15,
+        }
+
+@register('1/31bonds/TwoLocal2rep_piby3_kyiv_0.1')
+def _():
+    return doe_twolocal_common | doe_hw_common | {
+        'device':'ibm_kyiv',
+        'experiment_id': 'TwoLocal2rep_piby3_kyiv_0.1',
+        'ansatz_params': _AP[(2, 'bilinear')],
+        'alpha': 0.1,
+        }
+
+# 109 QUBITS
+# Twolocal bilinear entanglement
+@register('1/109bonds/TwoLocal1rep_piby3_AerSimulator_0.1')
+def _():
+    return doe_twolocal_common | doe_109qubits_common | {
+        'experiment_id': 'TwoLocal1rep_piby3_AerSimulator_0.1',
+        'ansatz_params': _AP[(1, 'bilinear')],
+        'alpha': 0.1,
+        }
+
+@register('1/109bonds/TwoLocal2rep_piby3_AerSimulator_0.1')
+def _():
+    return doe_twolocal_common | doe_109qubits_common | {
+        'experiment_id': 'TwoLocal2rep_piby3_AerSimulator_0.1',
+        'ansatz_params': _AP[(2, 'bilinear')],
+        'alpha': 0.1,
+        }
+
+# Hardware
+@register('1/109bonds/TwoLocal2rep_color_piby3_marrakersh_0.1')
+def _():
+    return doe_twolocal_common | doe_109qubits_common | doe_hw_common | {
+        'device':'ibm_marrakesh',
+        'experiment_id': 'TwoLocal2rep_color_piby3_marrakesh_0.1',
+        'ansatz_params': _AP[(2, 'color')],
+        'alpha': 0.1,
+        'max_epoch': 1,
+        }
+
+@register('1/109bonds/TwoLocal2rep_color_piby3_fez_0.1')
+def _():
+    return doe_twolocal_common | doe_109qubits_common | doe_hw_common | {
+        'device':'ibm_fez',
+        'experiment_id': 'TwoLocal2rep_color_piby3_fez_0.1',
+        'ansatz_params': _AP[(2, 'color')],
+        'alpha': 0.1,
+        'max_epoch': 1,
+        }
+
+@register('1/109bonds/TwoLocal2rep_bilinear_piby3_fez_0.1')
+def _():
+    return doe_twolocal_common | doe_109qubits_common | doe_hw_common | {
+        'device':'ibm_fez',
+        'experiment_id': 'TwoLocal2rep_bilinear_piby3_fez_0.1',
+        'ansatz_params': _AP[(2, 'bilinear')],
+        'alpha': 0.1,
+        'max_epoch': 1,
+        }
+
+@register('1/109bonds/bfcdR2rep_color_piby3_marrakesh_0.1')
+def _():
+    return doe_bfcdR_common | doe_109qubits_common | doe_hw_common | {
+        'device':'ibm_marrakesh',
+        'experiment_id': 'bfcdR2rep_color_piby3_marrakesh_0.1',
+        'ansatz_params': _AP[(2, 'color')],
+        'alpha': 0.1,
+        'max_epoch': 2,
+        }
+
+# 155 QUBITS
+# Twolocal bilinear entanglement
+@register('1/155bonds/TwoLocal2rep_piby3_AerSimulator_0.1')
+def _():
+    return doe_twolocal_common | doe_155qubits_common | {
+        'experiment_id': 'TwoLocal2rep_piby3_AerSimulator_0.1',
+        'ansatz_params': _AP[(2, 'bilinear')],
+        'alpha': 0.1,
+        }
+
+############ TEST ############
+@register('1/31bonds/test')
+def _():
+    return doe_twolocal_common | {
+        'experiment_id': 'test',
+        'ansatz_params': _AP[(1, 'bilinear')],
+        'alpha': 0.1,
+        'theta_threshold': .06,
+        'num_exec': 1,
+        'max_epoch': 1,
+        }
+
+# Custom Portfolio Problems for Vanguard Challenge
+register('custom/mean_variance_31_normal')(partial(_portfolio, LP_VG_MV_31, 'mean_variance_31_normal'))
+register('custom/esg_constrained_31')(partial(_portfolio, LP_VG_ESG_31, 'esg_constrained_31'))
+register('custom/index_tracking_31')(partial(_portfolio, LP_VG_IT_31, 'index_tracking_31'))
+# Converted Portfolio Problems for VQE
+register('converted/esg_constrained_31assets_esg7.0')(partial(_portfolio, LP_CONV_ESG_31, 'converted_esg_constrained_31'))
+register('converted/portfolio_31')(partial(_portfolio, LP_CONV_MV_31, 'converted_portfolio_31'))
+register('manual/portfolio_test')(partial(_portfolio, LP_CONV_MANUAL, 'manual_portfolio_test'))
+# register('manual/portfolio_test')(partial(_portfolio, LP_CONV_MANUAL, 'manual_portfolio_test',
+#                                           max_epoch=1,  # MINIMAL - just 1 epoch
+#                                           shots=512))   # VERY LOW shots
+register('109assets/test')(partial(_portfolio, LP_CONV_MV_109, '109assets_normal_risk', # BASE filename - let the code add the suffix
+                                   max_epoch=200, shots=4096))
+register('31assets/generated')(partial(_portfolio, LP_CONV_IT_31, '31assets_generated_test', shots=8192))
+register('custom/working_portfolio')(partial(_portfolio, LP_VG_WORKING, 'custom_working_portfolio'))
+register('scale/portfolio_109')(partial(_portfolio, LP_CONV_MV_109_CONVERTED, 'scale_109_assets',
+                                        max_epoch=6)) # Increase for larger problem
+register('manual/working_portfolio')(partial(_portfolio, LP_VG_WORKING, 'working_portfolio_test'))
+
+
+@dataclass(slots=True, frozen=True)
+class DoeEntry:
+    """Configuration of one experiment.
+
+    Also exposes keys()/__getitem__ so that `execute_multiple_runs(**entry)` keeps working.
+    """
+    experiment_id: str
+    lp_file: str
+    num_exec: int
+    ansatz: str
+    ansatz_params: dict
+    theta_initial: str
+    optimizer: str
+    device: str
+    max_epoch: int
+    alpha: float
+    shots: int
+    theta_threshold: float
+
+    def keys(self) -> tuple[str, ...]:
+        return _DOE_ENTRY_KEYS
+
+    def __getitem__(self, key: str):
+        if key not in _DOE_ENTRY_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def as_dict(self) -> dict:
+        return {key: getattr(self, key) for key in _DOE_ENTRY_KEYS}
+
+
+_DOE_ENTRY_KEYS = tuple(f.name for f in fields(DoeEntry))
+
+
+@cache
+def _build_entry(key: str) -> DoeEntry:
+    return DoeEntry(**_REGISTRY[key]())
+
+
+class DoeRegistry(Mapping):
+    """Experiment configurations, built on first access of each key."""
+
+    def __getitem__(self, key: str) -> DoeEntry:
+        if key not in _REGISTRY:
+            raise KeyError(key)
+        return _build_entry(key)
+
+    def __iter__(self):
+        return iter(_REGISTRY.keys())
+
+    def __len__(self) -> int:
+        return len(_REGISTRY)
+
+
+doe = MappingProxyType(DoeRegistry())
+
+
+def dump_json(path: str | Path) -> None:
+    """Write the materialised doe table to `path`, with lp_file relative to ROOT.
+
+    The snapshot can be shipped to sweep workers, which read it back with
+    `load_json` instead of importing (and re-executing) this module.
+    """
+    table = {key: entry.as_dict() | {'lp_file': Path(entry['lp_file']).relative_to(ROOT).as_posix()}
+             for key, entry in doe.items()}
+    Path(path).write_text(json.dumps(table, indent=1))
+
+
+def load_json(path: str | Path) -> dict[str, dict]:
+    """Read a snapshot written by `dump_json`, resolving lp_file against ROOT."""
+    table = json.loads(Path(path).read_bytes())
+    for entry in table.values():
+        entry['lp_file'] = os.path.join(ROOT_STR, entry['lp_file'])
+    return table
+
+
+if __name__ == '__main__':
+    dump_json(Path(__file__).with_suffix('.json'))
@@ -13,106 +13,198 @@ Focus areas:
 5. Index tracking problems
 """
 
+import os
+import pickle
+import re
 import numpy as np
 import pandas as pd
+from scipy import linalg, sparse
 import gurobipy as gp
 from gurobipy import GRB
 from pathlib import Path
-import random
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+
+# Constraint line ending with <=, >= or = followed by a number
+_CONSTR_RHS_RE = re.compile(r'(<=|>=|=)\s*[-+]?\d*\.?\d+(e[-+]?\d+)?$')
 
 class PortfolioGenerator:
     """Generate realistic portfolio optimization problems for VQE testing"""
     
-    def __init__(self, random_seed=42):
-        """Initialize with reproducible random seed"""
-        np.random.seed(random_seed)
-        random.seed(random_seed)
+    # Define major sectors with typical market caps
+    SECTORS = {
+        'Technology': 0.25,      # 25% of market
+        'Healthcare': 0.15,      # 15% of market  
+        'Financials': 0.12,      # 12% of market
+        'Consumer': 0.12,        # 12% of market
+        'Industrials': 0.10,     # 10% of market
+        'Energy': 0.08,          # 8% of market
+        'Materials': 0.06,       # 6% of market
+        'Utilities': 0.05,       # 5% of market
+        'Real Estate': 0.04,     # 4% of market
+        'Telecom': 0.03,         # 3% of market
+    }
+    # Sectors are encoded as their (int8) index in SECTOR_NAMES
+    SECTOR_NAMES = list(SECTORS)
+    
+    def __init__(self, random_seed=42, env=None, market_data=None):
+        """
+        Initialize with reproducible random seed
+        
+        All models are created in `env`; by default a silent GUROBI environment
+        shared by the models of this generator. The default environment is
+        started with the first model and disposed by close() (or on leaving a
+        `with` block); an environment passed in is left to its owner.
+        
+        `market_data` maps (n_assets, market_regime) to data returned by
+        generate_market_data(), reused instead of drawn from this generator.
+        """
+        self.rng = np.random.default_rng(random_seed)
+        self._env = env
+        self._owns_env = env is None
+        self._market_data = {key: self._freeze(data) for key, data in (market_data or {}).items()}
+    
+    @property
+    def env(self):
+        """GUROBI environment the models are created in"""
+        if self._env is None:
+            env = gp.Env(empty=True)
+            env.setParam('OutputFlag', 0)  # Silent mode
+            env.start()
+            self._env = env
+        return self._env
+    
+    def close(self):
+        """Dispose the default GUROBI environment, if this generator started one"""
+        if self._owns_env and self._env is not None:
+            self._env.dispose()
+            self._env = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
         
     def generate_realistic_returns(self, n_assets, market_regime='normal'):
         """Generate realistic expected returns based on market regime"""
         
         if market_regime == 'bull':
             # Bull market: higher returns, lower volatility
-            base_returns = np.random.normal(0.12, 0.05, n_assets)  # 12% average
-            volatilities = np.random.uniform(0.15, 0.25, n_assets)  # 15-25% vol
+            base_returns = self.rng.normal(0.12, 0.05, n_assets)  # 12% average
+            volatilities = self.rng.uniform(0.15, 0.25, n_assets)  # 15-25% vol
             
         elif market_regime == 'bear':
             # Bear market: lower/negative returns, higher volatility  
-            base_returns = np.random.normal(-0.05, 0.08, n_assets)  # -5% average
-            volatilities = np.random.uniform(0.25, 0.40, n_assets)  # 25-40% vol
+            base_returns = self.rng.normal(-0.05, 0.08, n_assets)  # -5% average
+            volatilities = self.rng.uniform(0.25, 0.40, n_assets)  # 25-40% vol
             
         elif market_regime == 'crisis':
             # Crisis: very negative returns, extreme volatility
-            base_returns = np.random.normal(-0.20, 0.15, n_assets)  # -20% average
-            volatilities = np.random.uniform(0.40, 0.80, n_assets)  # 40-80% vol
+            base_returns = self.rng.normal(-0.20, 0.15, n_assets)  # -20% average
+            volatilities = self.rng.uniform(0.40, 0.80, n_assets)  # 40-80% vol
             
         else:  # normal market
-            base_returns = np.random.normal(0.08, 0.06, n_assets)   # 8% average
-            volatilities = np.random.uniform(0.18, 0.30, n_assets)  # 18-30% vol
+            base_returns = self.rng.normal(0.08, 0.06, n_assets)   # 8% average
+            volatilities = self.rng.uniform(0.18, 0.30, n_assets)  # 18-30% vol
             
         return base_returns, volatilities
     
     def generate_sector_structure(self, n_assets):
-        """Create realistic sector allocation"""
-        
-        # Define major sectors with typical market caps
-        sectors = {
-            'Technology': 0.25,      # 25% of market
-            'Healthcare': 0.15,      # 15% of market  
-            'Financials': 0.12,      # 12% of market
-            'Consumer': 0.12,        # 12% of market
-            'Industrials': 0.10,     # 10% of market
-            'Energy': 0.08,          # 8% of market
-            'Materials': 0.06,       # 6% of market
-            'Utilities': 0.05,       # 5% of market
-            'Real Estate': 0.04,     # 4% of market
-            'Telecom': 0.03,         # 3% of market
-        }
+        """
+        Create realistic sector allocation
         
-        # Assign assets to sectors based on market cap weights
-        sector_assignments = []
-        sector_names = list(sectors.keys())
-        sector_weights = list(sectors.values())
+        Returns the sector name of each asset, the sector market weights and
+        the int8 sector code of each asset.
+        """
         
-        for i in range(n_assets):
-            sector = np.random.choice(sector_names, p=sector_weights)
-            sector_assignments.append(sector)
+        # Assign assets to sectors based on market cap weights
+        sector_codes = self.rng.choice(len(self.SECTOR_NAMES), size=n_assets,
+                                       p=list(self.SECTORS.values())).astype(np.int8)
+        sector_assignments = [self.SECTOR_NAMES[code] for code in sector_codes]
             
-        return sector_assignments, sectors
+        return sector_assignments, self.SECTORS, sector_codes
     
-    def generate_covariance_matrix(self, returns, volatilities, sector_assignments):
-        """Generate realistic covariance matrix with sector correlations"""
+    def generate_covariance_matrix(self, returns, volatilities, sector_codes):
+        """
+        Generate realistic covariance matrix with sector correlations
         
-        n_assets = len(returns)
+        The matrix is float32 (synthetic data needs no more precision); cast it
+        to float64 where it is handed to GUROBI.
+        """
         
-        # Base correlation matrix
-        correlation_matrix = np.eye(n_assets)
+        n_assets = len(returns)
         
-        # Add sector correlations (assets in same sector are more correlated)
-        for i in range(n_assets):
-            for j in range(i+1, n_assets):
-                if sector_assignments[i] == sector_assignments[j]:
-                    # Same sector: higher correlation (0.3-0.7)
-                    corr = np.random.uniform(0.3, 0.7)
-                else:
-                    # Different sectors: lower correlation (0.0-0.3)
-                    corr = np.random.uniform(0.0, 0.3)
-                
-                correlation_matrix[i, j] = corr
-                correlation_matrix[j, i] = corr
+        # Add sector correlations (assets in same sector are more correlated),
+        # drawn once per pair of the upper triangle and mirrored
+        sector_codes = np.asarray(sector_codes)
+        tri_i, tri_j = np.triu_indices(n_assets, 1)
+        same_sector = sector_codes[tri_i] == sector_codes[tri_j]
+        pair_correlations = np.where(
+            same_sector,
+            self.rng.uniform(0.3, 0.7, tri_i.size),  # Same sector: higher correlation (0.3-0.7)
+            self.rng.uniform(0.0, 0.3, tri_i.size),  # Different sectors: lower correlation (0.0-0.3)
+        )
+        correlation_matrix = np.eye(n_assets, dtype=np.float32)
+        correlation_matrix[tri_i, tri_j] = pair_correlations
+        correlation_matrix[tri_j, tri_i] = pair_correlations
         
         # Convert to covariance matrix
+        volatilities = np.asarray(volatilities, dtype=np.float32)
         vol_matrix = np.outer(volatilities, volatilities)
         covariance_matrix = correlation_matrix * vol_matrix
         
-        # Ensure positive semi-definite
-        eigenvals, eigenvecs = np.linalg.eigh(covariance_matrix)
-        eigenvals = np.maximum(eigenvals, 0.0001)  # Regularize small eigenvalues
-        covariance_matrix = eigenvecs @ np.diag(eigenvals) @ eigenvecs.T
+        # Ensure positive definite: load the diagonal until Cholesky succeeds
+        for _ in range(5):
+            try:
+                np.linalg.cholesky(covariance_matrix)
+                return covariance_matrix
+            except np.linalg.LinAlgError:
+                covariance_matrix = covariance_matrix + np.float32(0.0001) * np.eye(n_assets, dtype=np.float32)
+        
+        # Fall back to flooring the eigenvalues
+        eigenvals, eigenvecs = linalg.eigh(covariance_matrix, driver='evr', overwrite_a=True, check_finite=False)
+        np.maximum(eigenvals, np.float32(0.0001), out=eigenvals)  # Regularize small eigenvalues
+        covariance_matrix = (eigenvecs * eigenvals) @ eigenvecs.T
         
         return covariance_matrix
     
+    def generate_market_data(self, n_assets, market_regime='normal'):
+        """
+        Generate returns, volatilities, sectors (names and codes) and covariance for a market
+        
+        The data is generated once per (n_assets, market_regime) and shared by
+        every problem built on that market, so the arrays are read-only.
+        """
+        
+        key = (n_assets, market_regime)
+        if key not in self._market_data:
+            expected_returns, volatilities = self.generate_realistic_returns(n_assets, market_regime)
+            sector_assignments, _, sector_codes = self.generate_sector_structure(n_assets)
+            covariance_matrix = self.generate_covariance_matrix(expected_returns, volatilities, sector_codes)
+            self._market_data[key] = self._freeze((expected_returns, volatilities, tuple(sector_assignments),
+                                                   sector_codes, covariance_matrix))
+        
+        return self._market_data[key]
+    
+    @staticmethod
+    def _freeze(market_data):
+        """Make the arrays of shared market data read-only (unpickled copies come back writeable)"""
+        for item in market_data:
+            if isinstance(item, np.ndarray):
+                item.setflags(write=False)
+        return market_data
+    
+    @staticmethod
+    def portfolio_variance(weights, covariance_matrix):
+        """Portfolio variance w^T Σ w of a weight vector"""
+        return float(np.einsum('i,ij,j->', weights, covariance_matrix, weights))
+    
+    @staticmethod
+    def portfolio_return(weights, expected_returns):
+        """Portfolio expected return μ^T w of a weight vector"""
+        return float(np.asarray(expected_returns) @ weights)
+    
     def create_mean_variance_problem(self, n_assets=31, risk_aversion=1.0, 
                                    market_regime='normal', max_sector_weight=0.3):
         """
@@ -126,42 +218,38 @@ class PortfolioGenerator:
         """
         
         # Generate market data
-        expected_returns, volatilities = self.generate_realistic_returns(n_assets, market_regime)
-        sector_assignments, sector_info = self.generate_sector_structure(n_assets)
-        covariance_matrix = self.generate_covariance_matrix(expected_returns, volatilities, sector_assignments)
+        expected_returns, volatilities, sector_assignments, sector_codes, covariance_matrix = self.generate_market_data(
+            n_assets, market_regime)
         
         # Create GUROBI model
-        model = gp.Model(f"mean_variance_{n_assets}assets_{market_regime}")
-        model.setParam('OutputFlag', 0)  # Silent mode
+        model = gp.Model(f"mean_variance_{n_assets}assets_{market_regime}", env=self.env)
         
         # Decision variables: portfolio weights
-        weights = model.addVars(n_assets, name="w", lb=0.0, ub=1.0)
+        weights = model.addMVar(n_assets, name="w", lb=0.0, ub=1.0)
         
         # Objective: minimize risk - return tradeoff
-        portfolio_variance = gp.quicksum(
-            weights[i] * weights[j] * covariance_matrix[i, j] 
-            for i in range(n_assets) for j in range(n_assets)
-        )
+        sigma = np.ascontiguousarray(covariance_matrix, dtype=np.float64)
+        portfolio_variance = weights @ sigma @ weights
         
-        portfolio_return = gp.quicksum(
-            expected_returns[i] * weights[i] for i in range(n_assets)
-        )
+        portfolio_return = expected_returns @ weights
         
         # Set objective: λ * risk - return (minimize risk, maximize return)
         model.setObjective(risk_aversion * portfolio_variance - portfolio_return, GRB.MINIMIZE)
         
         # Budget constraint: weights sum to 1
-        model.addConstr(gp.quicksum(weights[i] for i in range(n_assets)) == 1.0, "budget")
+        model.addConstr(weights.sum() == 1.0, "budget")
         
-        # Sector constraints: max allocation per sector
-        unique_sectors = list(set(sector_assignments))
-        for sector in unique_sectors:
-            sector_assets = [i for i, s in enumerate(sector_assignments) if s == sector]
-            if len(sector_assets) > 1:  # Only add constraint if sector has multiple assets
-                sector_weight = gp.quicksum(weights[i] for i in sector_assets)
-                model.addConstr(sector_weight <= max_sector_weight, f"sector_{sector}")
+        # Sector constraints: max allocation per sector, one row of a sector x asset indicator matrix each
+        unique_sectors, sector_index = np.unique(sector_codes, return_inverse=True)
+        sector_matrix = sparse.csr_matrix((np.ones(n_assets), (sector_index, np.arange(n_assets))),
+                                          shape=(len(unique_sectors), n_assets))
+        multi_asset = np.bincount(sector_index) > 1  # Only add constraint if sector has multiple assets
+        model.addMConstr(sector_matrix[multi_asset], weights, GRB.LESS_EQUAL,
+                         np.full(multi_asset.sum(), max_sector_weight),
+                         name=[f"sector_{self.SECTOR_NAMES[code]}" for code in unique_sectors[multi_asset]])
         
         return model, {
+            'weights': weights,
             'expected_returns': expected_returns,
             'covariance_matrix': covariance_matrix, 
             'sector_assignments': sector_assignments,
@@ -177,34 +265,32 @@ class PortfolioGenerator:
         """
         
         # Generate market data  
-        expected_returns, volatilities = self.generate_realistic_returns(n_assets, market_regime)
-        sector_assignments, sector_info = self.generate_sector_structure(n_assets)
-        covariance_matrix = self.generate_covariance_matrix(expected_returns, volatilities, sector_assignments)
+        expected_returns, volatilities, sector_assignments, sector_codes, covariance_matrix = self.generate_market_data(
+            n_assets, market_regime)
         
         # Create GUROBI model
-        model = gp.Model(f"risk_parity_{n_assets}assets_{market_regime}")
-        model.setParam('OutputFlag', 0)
+        model = gp.Model(f"risk_parity_{n_assets}assets_{market_regime}", env=self.env)
         
         # Decision variables
-        weights = model.addVars(n_assets, name="w", lb=0.0, ub=1.0)
+        weights = model.addMVar(n_assets, name="w", lb=0.0, ub=1.0)
         
         # For simplicity, use naive risk parity: equal weights
         # In practice, this would be more complex
         target_weight = 1.0 / n_assets
         
-        # Minimize deviations from equal weights  
-        deviations = model.addVars(n_assets, name="dev", lb=0.0)
+        # Minimize deviations from equal weights: dev >= |w - target|
+        deviations = model.addMVar(n_assets, name="dev", lb=0.0)
         
-        for i in range(n_assets):
-            model.addConstr(deviations[i] >= weights[i] - target_weight)
-            model.addConstr(deviations[i] >= target_weight - weights[i])
+        model.addConstr(deviations - weights >= -target_weight)
+        model.addConstr(deviations + weights >= target_weight)
         
-        model.setObjective(gp.quicksum(deviations), GRB.MINIMIZE)
+        model.setObjective(deviations.sum(), GRB.MINIMIZE)
         
         # Budget constraint
-        model.addConstr(gp.quicksum(weights) == 1.0, "budget")
+        model.addConstr(weights.sum() == 1.0, "budget")
         
         return model, {
+            'weights': weights,
             'expected_returns': expected_returns,
             'covariance_matrix': covariance_matrix,
             'sector_assignments': sector_assignments,
@@ -220,37 +306,38 @@ class PortfolioGenerator:
         """
         
         # Generate market data
-        expected_returns, volatilities = self.generate_realistic_returns(n_assets, 'normal')
-        sector_assignments, sector_info = self.generate_sector_structure(n_assets)
-        covariance_matrix = self.generate_covariance_matrix(expected_returns, volatilities, sector_assignments)
+        expected_returns, volatilities, sector_assignments, sector_codes, covariance_matrix = self.generate_market_data(
+            n_assets, 'normal')
         
         # Create benchmark (market cap weighted)
-        market_caps = np.random.lognormal(10, 1, n_assets)  # Realistic market cap distribution
+        market_caps = self.rng.lognormal(10, 1, n_assets)  # Realistic market cap distribution
         benchmark_weights = market_caps / np.sum(market_caps)
         
         # Create GUROBI model
-        model = gp.Model(f"index_tracking_{n_assets}assets")
-        model.setParam('OutputFlag', 0)
+        model = gp.Model(f"index_tracking_{n_assets}assets", env=self.env)
         
         # Decision variables
-        weights = model.addVars(n_assets, name="w", lb=0.0, ub=1.0)
+        weights = model.addMVar(n_assets, name="w", lb=0.0, ub=1.0)
         
         # Minimize tracking error (simplified as sum of squared deviations)
-        tracking_error = gp.quicksum(
-            (weights[i] - benchmark_weights[i]) ** 2 for i in range(n_assets)
-        )
+        deviations = weights - benchmark_weights
+        tracking_error = deviations @ deviations
         
         model.setObjective(tracking_error, GRB.MINIMIZE)
         
         # Budget constraint
-        model.addConstr(gp.quicksum(weights) == 1.0, "budget")
+        model.addConstr(weights.sum() == 1.0, "budget")
         
-        # Individual position limits (can't deviate too much from benchmark)
-        for i in range(n_assets):
-            model.addConstr(weights[i] <= benchmark_weights[i] + 0.05, f"max_dev_{i}")
-            model.addConstr(weights[i] >= max(0, benchmark_weights[i] - 0.05), f"min_dev_{i}")
+        # Individual position limits (can't deviate too much from benchmark). Kept as
+        # constraint rows, not variable bounds: the LP converter ignores the Bounds section
+        identity = sparse.identity(n_assets, format='csr')
+        model.addMConstr(identity, weights, GRB.LESS_EQUAL, benchmark_weights + 0.05,
+                         name=[f"max_dev_{i}" for i in range(n_assets)])
+        model.addMConstr(identity, weights, GRB.GREATER_EQUAL, np.maximum(0.0, benchmark_weights - 0.05),
+                         name=[f"min_dev_{i}" for i in range(n_assets)])
         
         return model, {
+            'weights': weights,
             'benchmark_weights': benchmark_weights,
             'expected_returns': expected_returns,
             'covariance_matrix': covariance_matrix,
@@ -266,50 +353,45 @@ class PortfolioGenerator:
         """
         
         # Generate market data
-        expected_returns, volatilities = self.generate_realistic_returns(n_assets, 'normal')
-        sector_assignments, sector_info = self.generate_sector_structure(n_assets)
-        covariance_matrix = self.generate_covariance_matrix(expected_returns, volatilities, sector_assignments)
+        expected_returns, volatilities, sector_assignments, sector_codes, covariance_matrix = self.generate_market_data(
+            n_assets, 'normal')
         
         # Generate ESG scores (0-10 scale)
-        esg_scores = np.random.uniform(3, 10, n_assets)
+        esg_scores = self.rng.uniform(3, 10, n_assets)
         
         # Generate carbon intensity (higher for energy/materials)
-        carbon_intensity = np.zeros(n_assets)
-        for i, sector in enumerate(sector_assignments):
-            if sector in ['Energy', 'Materials', 'Industrials']:
-                carbon_intensity[i] = np.random.uniform(50, 200)  # High carbon
-            elif sector in ['Technology', 'Healthcare', 'Financials']:
-                carbon_intensity[i] = np.random.uniform(5, 30)    # Low carbon
-            else:
-                carbon_intensity[i] = np.random.uniform(20, 80)   # Medium carbon
+        high_carbon = np.isin(sector_codes, [self.SECTOR_NAMES.index(s) for s in ['Energy', 'Materials', 'Industrials']])
+        low_carbon = np.isin(sector_codes, [self.SECTOR_NAMES.index(s) for s in ['Technology', 'Healthcare', 'Financials']])
+        carbon_intensity = np.where(
+            high_carbon, self.rng.uniform(50, 200, n_assets),           # High carbon
+            np.where(low_carbon, self.rng.uniform(5, 30, n_assets),     # Low carbon
+                     self.rng.uniform(20, 80, n_assets)))               # Medium carbon
         
         # Create GUROBI model
-        model = gp.Model(f"esg_constrained_{n_assets}assets")
-        model.setParam('OutputFlag', 0)
+        model = gp.Model(f"esg_constrained_{n_assets}assets", env=self.env)
         
         # Decision variables
-        weights = model.addVars(n_assets, name="w", lb=0.0, ub=1.0)
+        weights = model.addMVar(n_assets, name="w", lb=0.0, ub=1.0)
         
         # Objective: minimize risk (simplified)
-        portfolio_variance = gp.quicksum(
-            weights[i] * weights[j] * covariance_matrix[i, j]
-            for i in range(n_assets) for j in range(n_assets)
-        )
+        sigma = np.ascontiguousarray(covariance_matrix, dtype=np.float64)
+        portfolio_variance = weights @ sigma @ weights
         
         model.setObjective(portfolio_variance, GRB.MINIMIZE)
         
         # Budget constraint
-        model.addConstr(gp.quicksum(weights) == 1.0, "budget")
+        model.addConstr(weights.sum() == 1.0, "budget")
         
         # ESG constraint: portfolio ESG score >= threshold
-        portfolio_esg = gp.quicksum(esg_scores[i] * weights[i] for i in range(n_assets))
+        portfolio_esg = esg_scores @ weights
         model.addConstr(portfolio_esg >= min_esg_score, "min_esg")
         
         # Carbon constraint: portfolio carbon intensity <= limit
-        portfolio_carbon = gp.quicksum(carbon_intensity[i] * weights[i] for i in range(n_assets))
+        portfolio_carbon = carbon_intensity @ weights
         model.addConstr(portfolio_carbon <= max_carbon, "max_carbon")
         
         return model, {
+            'weights': weights,
             'expected_returns': expected_returns,
             'covariance_matrix': covariance_matrix,
             'sector_assignments': sector_assignments,
@@ -317,7 +399,154 @@ class PortfolioGenerator:
             'carbon_intensity': carbon_intensity
         }
 
-def create_vanguard_test_suite(output_dir="vanguard_problems"):
+def fix_lp_file(lp_filename):
+    """
+    Rewrite an LP file with every constraint on a single line and no commas
+    
+    The file is streamed in one pass into a temporary file that then replaces it.
+    """
+    
+    lp_filename = Path(lp_filename)
+    tmp_filename = lp_filename.with_name(lp_filename.name + '.tmp')
+    
+    with open(lp_filename, 'r') as src, open(tmp_filename, 'w') as dst:
+        merged_line = None  # multiline constraint being merged
+        for line in src:
+            line = line.strip()
+            
+            if merged_line is not None:
+                # Flush the constraint if line looks like start of new constraint or section
+                if line == '' or (':' in line and not line.startswith(('+', '-'))):
+                    dst.write(merged_line.replace(',', '') + '\n')
+                    merged_line = None
+                else:
+                    merged_line += ' ' + line
+                    # Stop merging if line ends with <=, >= or = with number
+                    if _CONSTR_RHS_RE.search(merged_line):
+                        # Remove *all* commas inside the constraint line (LP format does not support commas in constraints)
+                        dst.write(merged_line.replace(',', '') + '\n')
+                        merged_line = None
+                    continue
+            
+            if ':' in line and not _CONSTR_RHS_RE.search(line):
+                # Start of multiline constraint — merge all continuation lines
+                merged_line = line
+            else:
+                # Remove trailing commas just in case
+                dst.write(line.rstrip(',') + '\n')
+        
+        if merged_line is not None:
+            dst.write(merged_line.replace(',', '') + '\n')
+    
+    os.replace(tmp_filename, lp_filename)
+
+def _create_suite_problem(i, n_problems, config, output_path, market_data, problem_seed, threads):
+    """
+    Build, solve and save one problem of the test suite
+    
+    Runs in a worker process of create_vanguard_test_suite, on the market data
+    generated by the parent; everything specific to the problem (benchmark,
+    ESG scores, ...) is drawn from problem_seed. Returns the summary entry of
+    the problem, or None if it could not be created.
+    """
+    
+    print(f"\n📊 Creating Problem {i+1}/{n_problems}: {config['type']} ({config['n_assets']} assets)")
+    market_key = (config['n_assets'], config.get('market', 'normal'))
+    generator = PortfolioGenerator(problem_seed, market_data={market_key: market_data})
+    model = None
+    
+    try:
+        if config['type'] == 'mean_variance':
+            model, metadata = generator.create_mean_variance_problem(
+                n_assets=config['n_assets'],
+                risk_aversion=config['risk_aversion'],
+                market_regime=config['market']
+            )
+            problem_name = f"mean_variance_{config['n_assets']}assets_{config['market']}_risk{config['risk_aversion']}"
+            
+        elif config['type'] == 'index_tracking':
+            model, metadata = generator.create_index_tracking_problem(
+                n_assets=config['n_assets'],
+                tracking_error_limit=config['tracking_error']
+            )
+            problem_name = f"index_tracking_{config['n_assets']}assets_te{config['tracking_error']}"
+            
+        elif config['type'] == 'esg_constrained':
+            model, metadata = generator.create_esg_constrained_problem(
+                n_assets=config['n_assets'],
+                min_esg_score=config['min_esg'],
+                max_carbon=config['max_carbon']
+            )
+            problem_name = f"esg_constrained_{config['n_assets']}assets_esg{config['min_esg']}"
+            
+        elif config['type'] == 'risk_parity':
+            model, metadata = generator.create_risk_parity_problem(
+                n_assets=config['n_assets'],
+                market_regime=config.get('market', 'normal')
+            )
+            problem_name = f"risk_parity_{config['n_assets']}assets"
+        
+        # The weights MVar handle is not part of the pickled metadata
+        weights = metadata.pop('weights')
+        
+        # Solve classically with GUROBI
+        model.Params.Threads = threads  # Share the CPUs with the other workers
+        model.optimize()
+        
+        if model.status == GRB.OPTIMAL:
+            classical_objective = model.objVal
+            classical_solution = weights.X
+            
+            print(f"   ✅ Classical solution found: objective = {classical_objective:.6f}")
+            
+            # Save LP file for quantum optimization
+            lp_filename = output_path / f"{problem_name}.lp"
+            model.write(str(lp_filename))  # IMPORTANT: Write LP file here
+            
+            # Post-process LP file to fix multi-line constraints and trailing commas
+            fix_lp_file(lp_filename)
+            
+            # Save metadata for analysis
+            metadata.update({
+                'problem_name': problem_name,
+                'classical_objective': classical_objective,
+                'classical_solution': classical_solution.tolist(),
+                'classical_variance': generator.portfolio_variance(
+                    classical_solution, metadata['covariance_matrix']),
+                'classical_return': generator.portfolio_return(
+                    classical_solution, metadata['expected_returns']),
+                'problem_type': config['type'],
+                'n_assets': config['n_assets']
+            })
+            
+            metadata_filename = output_path / f"{problem_name}_metadata.pkl"
+            with open(metadata_filename, 'wb') as f:
+                pickle.dump(metadata, f, protocol=5)
+            
+            return {
+                'name': problem_name,
+                'lp_file': str(lp_filename),
+                'metadata_file': str(metadata_filename),
+                'classical_objective': classical_objective,
+                'n_assets': config['n_assets'],
+                'type': config['type']
+            }
+            
+        print(f"   ❌ Failed to solve classically (status: {model.status})")
+        return None
+            
+    except Exception as e:
+        print(f"   ❌ Error creating problem: {e}")
+        return None
+    
+    finally:
+        # Pooled workers run many tasks: release the model and the environment
+        # (and its license session) before the next one
+        if model is not None:
+            model.dispose()
+        generator.close()
+
+def create_vanguard_test_suite(output_dir="vanguard_problems", max_workers=None, random_seed=42):
     """
     Create a comprehensive test suite for the Vanguard challenge
     
@@ -326,14 +555,14 @@ def create_vanguard_test_suite(output_dir="vanguard_problems"):
     2. Different sizes (31, 109, 155 assets) 
     3. Different market conditions (bull, bear, normal, crisis)
     4. Increasing constraint complexity
+    
+    Problems are independent and are built in parallel by up to max_workers
+    processes (default: one per problem, capped at the number of CPUs).
     """
     
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
-    generator = PortfolioGenerator()
-    problems_created = []
-    
     print("🏗️  Creating Vanguard Portfolio Optimization Test Suite...")
     print("="*60)
     
@@ -349,121 +578,31 @@ def create_vanguard_test_suite(output_dir="vanguard_problems"):
         {'type': 'mean_variance', 'n_assets': 155, 'market': 'normal', 'risk_aversion': 1.0},
     ]
     
-    import re
-    
-    for i, config in enumerate(configurations):
-        print(f"\n📊 Creating Problem {i+1}/{len(configurations)}: {config['type']} ({config['n_assets']} assets)")
-        
-        try:
-            if config['type'] == 'mean_variance':
-                model, metadata = generator.create_mean_variance_problem(
-                    n_assets=config['n_assets'],
-                    risk_aversion=config['risk_aversion'],
-                    market_regime=config['market']
-                )
-                problem_name = f"mean_variance_{config['n_assets']}assets_{config['market']}_risk{config['risk_aversion']}"
-                
-            elif config['type'] == 'index_tracking':
-                model, metadata = generator.create_index_tracking_problem(
-                    n_assets=config['n_assets'],
-                    tracking_error_limit=config['tracking_error']
-                )
-                problem_name = f"index_tracking_{config['n_assets']}assets_te{config['tracking_error']}"
-                
-            elif config['type'] == 'esg_constrained':
-                model, metadata = generator.create_esg_constrained_problem(
-                    n_assets=config['n_assets'],
-                    min_esg_score=config['min_esg'],
-                    max_carbon=config['max_carbon']
-                )
-                problem_name = f"esg_constrained_{config['n_assets']}assets_esg{config['min_esg']}"
-                
-            elif config['type'] == 'risk_parity':
-                model, metadata = generator.create_risk_parity_problem(
-                    n_assets=config['n_assets'],
-                    market_regime=config.get('market', 'normal')
-                )
-                problem_name = f"risk_parity_{config['n_assets']}assets"
-            
-            # Solve classically with GUROBI
-            model.optimize()
-            
-            if model.status == GRB.OPTIMAL:
-                classical_objective = model.objVal
-                classical_solution = [var.x for var in model.getVars() if var.varName.startswith('w')]
-                
-                print(f"   ✅ Classical solution found: objective = {classical_objective:.6f}")
-                
-                # Save LP file for quantum optimization
-                lp_filename = output_path / f"{problem_name}.lp"
-                model.write(str(lp_filename))  # IMPORTANT: Write LP file here
-                
-                # Post-process LP file to fix multi-line constraints and trailing commas
-                
-                with open(str(lp_filename), 'r') as f:
-                    lines = f.readlines()
-
-                fixed_lines = []
-                i = 0
-                while i < len(lines):
-                    line = lines[i].rstrip('\n').strip()
-
-                    if ':' in line and not re.search(r'(<=|>=|=)\s*[-+]?\d*\.?\d+(e[-+]?\d+)?$', line):
-                        # Start of multiline constraint — merge all continuation lines
-                        merged_line = line
-                        i += 1
-                        while i < len(lines):
-                            next_line = lines[i].rstrip('\n').strip()
-                            # Break if next line looks like start of new constraint or section
-                            if next_line == '' or (':' in next_line and not next_line.startswith(('+', '-'))):
-                                break
-                            merged_line += ' ' + next_line
-                            i += 1
-                            # Stop merging if line ends with <=, >= or = with number
-                            if re.search(r'(<=|>=|=)\s*[-+]?\d*\.?\d+(e[-+]?\d+)?$', merged_line):
-                                break
-                        # Remove *all* commas inside the constraint line (LP format does not support commas in constraints)
-                        merged_line = merged_line.replace(',', '')
-                        fixed_lines.append(merged_line)
-                    else:
-                        # Remove trailing commas just in case
-                        line = line.rstrip(',')
-                        fixed_lines.append(line)
-                        i += 1
-
-                with open(str(lp_filename), 'w') as f:
-                    for fixed_line in fixed_lines:
-                        f.write(fixed_line + '\n')
-                
-                # Save metadata for analysis
-                metadata.update({
-                    'problem_name': problem_name,
-                    'classical_objective': classical_objective,
-                    'classical_solution': classical_solution,
-                    'problem_type': config['type'],
-                    'n_assets': config['n_assets']
-                })
-                
-                metadata_filename = output_path / f"{problem_name}_metadata.pkl"
-                import pickle
-                with open(metadata_filename, 'wb') as f:
-                    pickle.dump(metadata, f)
-                
-                problems_created.append({
-                    'name': problem_name,
-                    'lp_file': str(lp_filename),
-                    'metadata_file': str(metadata_filename),
-                    'classical_objective': classical_objective,
-                    'n_assets': config['n_assets'],
-                    'type': config['type']
-                })
-                
-            else:
-                print(f"   ❌ Failed to solve classically (status: {model.status})")
-                
-        except Exception as e:
-            print(f"   ❌ Error creating problem: {e}")
-            continue
+    # Independent random streams spawned from random_seed: one per market (assets,
+    # regime), so problems on the same market are built on the same market data,
+    # and one per problem for the draws specific to it. Neither depends on which
+    # worker process builds the problem
+    n_problems = len(configurations)
+    market_keys = [(config['n_assets'], config.get('market', 'normal')) for config in configurations]
+    market_streams, problem_streams = np.random.SeedSequence(random_seed).spawn(2)
+    unique_markets = list(dict.fromkeys(market_keys))
+    
+    # Generate each market once here rather than in every worker that needs it
+    market_data = {}
+    for key, market_seed in zip(unique_markets, market_streams.spawn(len(unique_markets))):
+        with PortfolioGenerator(market_seed) as market_generator:
+            market_data[key] = market_generator.generate_market_data(*key)
+    
+    if max_workers is None:
+        max_workers = min(len(configurations), os.cpu_count() or 1)
+    threads = max(1, (os.cpu_count() or 1) // max_workers)  # Avoid oversubscribing GUROBI threads
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_create_suite_problem, range(n_problems), [n_problems] * n_problems,
+                               configurations, [output_path] * n_problems,
+                               [market_data[key] for key in market_keys], problem_streams.spawn(n_problems),
+                               [threads] * n_problems)
+        problems_created = [problem for problem in results if problem is not None]
     
     # Write summary report
     summary_file = output_path / "problem_suite_summary.txt"
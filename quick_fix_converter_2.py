@@ -4,36 +4,204 @@ Quick Fix LP Format Converter - Windows Compatible
 Just fixes the ROOT issue so you can keep moving
 """
 
+import functools
+import glob
+import io
 import re
 import os
 import sys
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
 
 # HARDCODED FIX for Windows - replace with your actual path if needed
 ROOT = r"C:\path\to\WISER_Optimization_VG"
 
+# Constraint sense operators
+_SENSE_RE = re.compile(r'(<=|>=|=)')
+
+# Characters that end a variable name
+_NAME_STOP_CHARS = frozenset('+-*^<>=:')
+# Kinds of tokens that stand on their own between spaces, as GUROBI writes them;
+# brackets and '/' only delimit quadratic sections ('[ x ^2 ] / 2'), a relation
+# ('>=') ends the current term
+_PUNCTUATION_KINDS = {
+    '*': 'op', '^': 'op', '[': 'skip', ']': 'skip', '/': 'skip',
+    '<=': 'rel', '>=': 'rel', '=<': 'rel', '=>': 'rel', '<': 'rel', '>': 'rel', '=': 'rel',
+}
+
+
+def _ends_with_mantissa(text: str) -> bool:
+    """True if text ends in a number and 'e' or 'E', i.e. the start of an exponent ('1e-3')"""
+    if text[-1:] not in ('e', 'E'):
+        return False
+    
+    i = len(text) - 1
+    while i and (text[i - 1].isdigit() or text[i - 1] == '.'):
+        i -= 1
+    
+    # The digits must not be the tail of a name ('x2e')
+    return text[i:-1].strip('.') != '' and (i == 0 or text[i - 1].isspace() or text[i - 1] in '*^[/<>=:')
+
+
+def _signed_chunks(expr: str) -> List[Tuple[str, str]]:
+    """
+    Split expr at every '+' and '-' into (sign, chunk) pairs, the first with sign ''
+    
+    A sign inside an exponent ('1e-3') does not split; its chunk is joined back.
+    """
+    chunks = []
+    for i, plus_part in enumerate(expr.split('+')):
+        for j, part in enumerate(plus_part.split('-')):
+            sign = '-' if j else '+' if i else ''
+            if sign and _ends_with_mantissa(chunks[-1][1]):
+                chunks[-1] = (chunks[-1][0], chunks[-1][1] + sign + part)
+            else:
+                chunks.append((sign, part))
+    return chunks
+
+
+def _split_token(token: str) -> List[Tuple[str, str]]:
+    """
+    Cut a token with attached parts ('3x', '2.5*x', 'x^2', ']/2') into (kind, text) pieces
+    
+    A character that starts no piece comes back as a 'bad' piece.
+    """
+    pieces = []
+    i, n = 0, len(token)
+    
+    while i < n:
+        c = token[i]
+        j = i + 1
+        
+        if '0' <= c <= '9' or (c == '.' and j < n and '0' <= token[j] <= '9'):
+            while j < n and '0' <= token[j] <= '9':
+                j += 1
+            if c != '.' and j < n and token[j] == '.':
+                j += 1
+                while j < n and '0' <= token[j] <= '9':
+                    j += 1
+            
+            # Exponent, only if digits follow ('2e-3', but '2ex' is 2 times ex)
+            k = j + 1
+            if k < n and token[j] in 'eE':
+                if token[k] in '+-':
+                    k += 1
+                if k < n and '0' <= token[k] <= '9':
+                    j = k + 1
+                    while j < n and '0' <= token[j] <= '9':
+                        j += 1
+            kind = 'number'
+        elif c.isalpha() or c == '_':
+            while j < n and token[j] not in _NAME_STOP_CHARS:
+                j += 1
+            kind = 'name'
+        elif c in '+-':
+            kind = 'sign'
+        elif c in '<>=':
+            while j < n and token[j] in '<>=':
+                j += 1
+            kind = 'rel'
+        else:
+            kind = _PUNCTUATION_KINDS.get(c, 'bad')
+        
+        pieces.append((kind, token[i:j]))
+        i = j
+    
+    return pieces
+
+
+# w[0] -> w_0
+_BRACKET_TABLE = str.maketrans({'[': '_', ']': ''})
+# Index suffixes in general (x[1][2] -> x_1_2); other brackets (x[a,b]) are kept
+_INDEX_RE = re.compile(r'\[([0-9]+)\]')
+
+# Section header keywords (lowercased) and the section they start
+_SECTION_HEADERS = {
+    'minimize': 'objective', 'maximize': 'objective', 'minimum': 'objective', 'maximum': 'objective',
+    'min': 'objective', 'max': 'objective', 'obj': 'objective',
+    'subject to': 'constraints', 'such that': 'constraints', 's.t.': 'constraints', 'st': 'constraints',
+    'constraints': 'constraints',
+    'bounds': 'bounds', 'bound': 'bounds',
+    'generals': 'integrality', 'general': 'integrality', 'gen': 'integrality',
+    'integers': 'integrality', 'integer': 'integrality',
+    'binaries': 'integrality', 'binary': 'integrality', 'bin': 'integrality',
+    'semi-continuous': 'integrality', 'semis': 'integrality', 'semi': 'integrality',
+    'end': 'end',
+}
+# Longer lines are never headers, so expression lines skip the normalization
+_MAX_HEADER_LEN = 32
+
+
+def _header_section(line: str) -> Optional[str]:
+    """
+    Section started by a header line, or None
+    
+    A header is a line holding only the keyword, so variables named like one
+    ('min + x >= 1', 'end - y') stay expression lines. Constraint headers may
+    end in ':' ('subject to:').
+    """
+    if len(line) > _MAX_HEADER_LEN:
+        return None
+    
+    keyword = " ".join(line.lower().split())
+    section = _SECTION_HEADERS.get(keyword)
+    if section is None and keyword.endswith(':'):
+        section = _SECTION_HEADERS.get(keyword[:-1].rstrip())
+        if section != 'constraints':
+            return None
+    return section
+
+
+@functools.cache
+def _ensure_output_dir(output_dir: str) -> Path:
+    """Create the default output directory once per process"""
+    path = Path(output_dir)
+    path.mkdir(exist_ok=True)
+    return path
+
 class LPFormatConverter:
     """Convert standard LP format to VQE-compatible representation"""
     
     def __init__(self):
         self.objective_terms = {}
-        self.constraints = []
+        
+        # Constraints as parallel arrays (CSR rows): the terms of constraint k are
+        # columns col_idx[row_ptr[k]:row_ptr[k + 1]] with coefficients coef[...]
+        self.constraint_names = []
+        self.constraint_senses = []
+        self.constraint_rhs = array('d')
+        self.row_ptr = array('i', [0])
+        self.col_idx = array('i')
+        self.coef = array('d')
+        
         self.bounds = {}
-        self.variables = set()
+        self.variables = {}  # Variable name -> column index
+        self.columns = []    # Column index -> variable name
+        self._var_names = {}  # Raw variable token -> normalized name
 
     def _normalize_var_name(self, var: str) -> str:
         """Convert variable names like w[0] into w_0 for CPLEX compatibility"""
-        # Replace brackets with underscore notation
-        return re.sub(r'\[([0-9]+)\]', r'_\1', var)
+        # Replace [digits] with underscore notation; intern so every occurrence shares one string
+        _, bracket, index = var.partition('[')
+        if not bracket:
+            name = var
+        elif index[-1:] == ']' and index[:-1].isascii() and index[:-1].isdigit():
+            name = var.translate(_BRACKET_TABLE)  # A single index suffix, the common case
+        else:
+            name = _INDEX_RE.sub(r'_\1', var)
+        return sys.intern(name)
 
     def convert_file(self, input_file: str, output_file: str = None) -> str:
         """Main conversion function"""
         if output_file is None:
             # Create output in converted_problems directory
             input_path = Path(input_file)
-            output_dir = Path("converted_problems")
-            output_dir.mkdir(exist_ok=True)
+            output_dir = _ensure_output_dir("converted_problems")
             output_file = output_dir / f"{input_path.stem}_converted.lp"
         
         print(f"🔄 Converting {input_file} -> {output_file}")
@@ -44,30 +212,23 @@ class LPFormatConverter:
         # Generate VQE-compatible format
         self._write_vqe_format(str(output_file))
         
-        print(f"✅ Conversion complete: {len(self.constraints)} constraints, {len(self.variables)} variables")
+        print(f"✅ Conversion complete: {len(self.constraint_names)} constraints, {len(self.variables)} variables")
         return str(output_file)
     
     def _parse_lp_file(self, filename: str):
         """Parse GUROBI .lp file format with proper constraint handling"""
         with open(filename, 'r') as f:
-            content = f.read()
-        
-        # Clean up content
-        content = re.sub(r'\\.*$', '', content, flags=re.MULTILINE)  # Remove comments
-        content = re.sub(r'\s+', ' ', content)  # Normalize whitespace
-        
-        # Split into sections
-        sections = self._split_sections(content)
-        
-        # Parse each section
-        if 'objective' in sections:
-            self.objective_terms = self._parse_objective(sections['objective'])
-        
-        if 'constraints' in sections:
-            self.constraints = self._parse_constraints_fixed(sections['constraints'])
-        
-        if 'bounds' in sections:
-            self.bounds = self._parse_bounds(sections['bounds'])
+            # Stream the file one section at a time
+            for section, section_lines in groupby(self._split_sections(f), key=itemgetter(0)):
+                lines = (line for _, line in section_lines)
+                
+                # Parse each section
+                if section == 'objective':
+                    self.objective_terms = self._parse_objective(" ".join(lines))
+                elif section == 'constraints':
+                    self._parse_constraints_fixed(lines)
+                elif section == 'bounds':
+                    self.bounds = self._parse_bounds(" ".join(lines))
     
     # def _split_sections(self, content: str) -> Dict[str, str]:
     #     """Split LP content into sections"""
@@ -87,51 +248,30 @@ class LPFormatConverter:
         
     #     return sections
     
-    def _split_sections(self, content: str) -> Dict[str, str]:
-        """Split LP content into sections"""
-        sections = {}
-        
-        patterns = {
-            'objective': r'(minimize|maximize|min|max|obj)(.*?)(?=subject to|s\.t\.|constraints|bounds|end|\Z)',
-            'constraints': r'(subject to|s\.t\.|constraints)(.*?)(?=bounds|end|\Z)',
-            'bounds': r'(bounds)(.*?)(?=end|\Z)',  # changed to always have two groups
-        }
-        
-        for section_name, pattern in patterns.items():
-            match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-            if match:
-                # Get the last captured group that actually has content
-                # text_part = next((g for g in match.groups()[1:] if g is not None), "")
-                text_part = " ".join(g for g in match.groups()[1:] if g)
-                sections[section_name] = text_part.strip()
-        
-        return sections
-    
-    def fix_scientific_notation_bug(tokens):
-        fixed_tokens = []
-        skip_next = False
-        for i, tok in enumerate(tokens):
-            if skip_next:
-                skip_next = False
-                continue
-
-            # If we see a floating number followed by a single 'e', merge with next token
-            if re.fullmatch(r"\d+\.\d+", tok) and i + 2 < len(tokens) and tokens[i+1].lower() == 'e':
-                merged = tok + tokens[i+1] + tokens[i+2]  # merge number + 'e' + exponent
-                fixed_tokens.append(merged)
-                skip_next = True  # skip exponent token
+    def _split_sections(self, lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (section, line) for each cleaned, non-empty LP line up to 'end'
+        
+        Lines are only stripped: the expression tokenizer splits on any
+        whitespace, so runs of spaces inside a line are left alone.
+        """
+        section = None
+        
+        for line in lines:
+            # Remove comments
+            line = line.partition('\\')[0].strip()
+            if not line:
                 continue
-
-            # If number followed by lone 'e' (no exponent), treat 'e' as a variable
-            if re.fullmatch(r"\d+\.\d+", tok) and i + 1 < len(tokens) and tokens[i+1].lower() == 'e':
-                # Here you can rename the 'e' variable to something like w_xxx or keep as is
-                fixed_tokens.append(tok)
-                fixed_tokens.append("w_e")  # give it a proper variable name
-                skip_next = True
+            
+            header = _header_section(line)
+            if header:
+                section = header
+                if section == 'end':
+                    break
                 continue
-
-            fixed_tokens.append(tok)
-        return fixed_tokens
+            
+            if section:
+                yield section, line
     
     # def _parse_objective(self, obj_text: str) -> Dict[str, float]:
     #     """Parse objective function"""
@@ -155,31 +295,18 @@ class LPFormatConverter:
     
     def _parse_objective(self, obj_text: str) -> Dict[str, float]:
         """Parse objective function with proper float exponent support"""
-        objective_terms = {}
+        # Drop an 'obj:' style label
+        label, colon, expr = obj_text.partition(':')
+        if not colon or ' ' in label.strip():
+            expr = obj_text
         
-        # New regex pattern to correctly capture numbers with exponents and variables
-        pattern = r'([+-]?\s*\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)[ ]*\*?[ ]*([a-zA-Z_][a-zA-Z0-9_\[\]]*)'
-        
-        matches = re.finditer(pattern, obj_text)
-        
-        for match in matches:
-            coeff_str, var = match.groups()
-            coeff = self._parse_coefficient(coeff_str)
-            
-            if var:
-                var = self._normalize_var_name(var.strip())
-                objective_terms[var] = objective_terms.get(var, 0) + coeff
-                self.variables.add(var)
-        
-        return objective_terms
+        return self._parse_linear_expression(expr)
 
     
-    def _parse_constraints_fixed(self, constraint_text: str) -> List[Dict[str, Any]]:
+    def _parse_constraints_fixed(self, lines: Iterable[str]):
         """FIXED VERSION: Properly handle multi-line constraints"""
-        constraints = []
-        lines = constraint_text.strip().split('\n')
-        
-        current_constraint = ""
+        # Lines of the current constraint, joined once it is complete
+        current_parts = []
         constraint_name = ""
         
         for line in lines:
@@ -190,26 +317,37 @@ class LPFormatConverter:
             # Check if this starts a new constraint (has colon and doesn't start with +/-)
             if ':' in line and not line.startswith(('+', '-')):
                 # Process previous constraint
+                current_constraint = " ".join(current_parts)
                 if current_constraint and constraint_name:
                     constraint_dict = self._parse_single_constraint_fixed(constraint_name, current_constraint)
                     if constraint_dict:
-                        constraints.append(constraint_dict)
+                        self._store_constraint(constraint_dict)
                 
                 # Start new constraint
                 name_part, expr_part = line.split(':', 1)
                 constraint_name = name_part.strip()
-                current_constraint = expr_part.strip()
+                current_parts = [expr_part.strip()]
             else:
                 # Continuation line
-                current_constraint += " " + line
+                current_parts.append(line)
         
         # Process final constraint
+        current_constraint = " ".join(current_parts)
         if current_constraint and constraint_name:
             constraint_dict = self._parse_single_constraint_fixed(constraint_name, current_constraint)
             if constraint_dict:
-                constraints.append(constraint_dict)
-        
-        return constraints
+                self._store_constraint(constraint_dict)
+    
+    def _store_constraint(self, constraint_dict: Dict[str, Any]):
+        """Append a parsed constraint as a new row of the constraint arrays"""
+        terms = constraint_dict['terms']
+        
+        self.constraint_names.append(constraint_dict['name'])
+        self.constraint_senses.append(constraint_dict['sense'])
+        self.constraint_rhs.append(constraint_dict['rhs'])
+        self.col_idx.extend([self.variables[var] for var in terms])
+        self.coef.extend(terms.values())
+        self.row_ptr.append(len(self.col_idx))
     
     def _parse_single_constraint_fixed(self, name: str, expr: str) -> Dict[str, Any]:
         """Parse a single constraint expression"""
@@ -221,35 +359,23 @@ class LPFormatConverter:
                 'rhs': 0.0
             }
             
-            # Find constraint sense
-            sense_patterns = [
-                ('<=', r'(.+?)\s*<=\s*(.+)'),
-                ('>=', r'(.+?)\s*>=\s*(.+)'),
-                ('=', r'(.+?)\s*=\s*(.+)')
-            ]
-            
+            # Find constraint sense: split once on the first operator
             lhs_expr = expr
-            rhs_value = 0.0
+            parts = _SENSE_RE.split(expr, maxsplit=1)
             
-            for sense, pattern in sense_patterns:
-                match = re.search(pattern, expr)
-                if match:
-                    lhs_expr = match.group(1).strip()
-                    rhs_str = match.group(2).strip()
-                    constraint_dict['sense'] = sense
-                    
-                    try:
-                        rhs_value = float(rhs_str)
-                    except ValueError:
-                        rhs_value = 0.0
-                    
-                    constraint_dict['rhs'] = rhs_value
-                    break
+            if len(parts) == 3:
+                lhs_expr, constraint_dict['sense'], rhs_str = parts
+                
+                try:
+                    rhs_value = float(rhs_str)
+                except ValueError:
+                    rhs_value = 0.0
+                
+                constraint_dict['rhs'] = rhs_value
             
             # Parse LHS terms
             terms = self._parse_linear_expression(lhs_expr)
             constraint_dict['terms'] = terms
-            self.variables.update(terms.keys())
             
             return constraint_dict
             
@@ -258,107 +384,190 @@ class LPFormatConverter:
             return None
     
     def _parse_linear_expression(self, expr: str) -> Dict[str, float]:
-        """Parse linear expression and extract variable coefficients"""
-        terms = {}
-        
-        # Pattern for portfolio variables (allow brackets inside var names)
-        pattern = r'([+-]?\s*\d*\.?\d*)\s*\*?\s*([a-zA-Z_][a-zA-Z0-9_\[\]]*)'
-        
-        for match in re.finditer(pattern, expr):
-            coeff_str, var = match.groups()
-            coeff = self._parse_coefficient(coeff_str)
+        """
+        Parse linear expression and extract variable coefficients
+        
+        Quadratic terms (c x ^2, c x * y) count only towards their first
+        variable, with coefficient c. The expression is split into signed
+        chunks at '+' and '-', and each chunk on whitespace; only tokens with
+        attached parts are cut up character by character, so no spaces are
+        needed ('2x+3y', '-x-y', '2.5*x' and '1e-3 x' all parse). A character
+        that fits no token raises ValueError rather than silently losing a term.
+        Normalized variable names are memoized per raw token, since the same
+        tokens repeat across the objective and every constraint; a name gets
+        its column the first time its token is seen.
+        """
+        var_names = self._var_names
+        terms = defaultdict(float)
+        sign, coeff = 1.0, None
+        after_var = skip_next = False
+        
+        for sign_token, chunk in _signed_chunks(expr):
+            pieces = [('sign', sign_token)] if sign_token else []
             
-            if var.strip():
-                var = self._normalize_var_name(var.strip())
-                terms[var] = terms.get(var, 0) + coeff
+            # Plain names, numbers and punctuation go straight through
+            for token in chunk.split():
+                kind = _PUNCTUATION_KINDS.get(token)
+                if kind is None:
+                    c = token[0]
+                    if (c.isalpha() or c == '_') and _NAME_STOP_CHARS.isdisjoint(token):
+                        kind = 'name'
+                    elif c.isdigit() or c == '.':
+                        try:
+                            float(token)
+                            kind = 'number'
+                        except ValueError:
+                            pass
+                if kind is None:
+                    pieces.extend(_split_token(token))
+                else:
+                    pieces.append((kind, token))
+            
+            for kind, token in pieces:
+                if kind == 'name':
+                    if skip_next:
+                        skip_next = False  # Second factor of a product
+                    else:
+                        var = var_names.get(token)
+                        if var is None:
+                            var = var_names[token] = self._normalize_var_name(token)
+                            if var not in self.variables:
+                                self.variables[var] = len(self.columns)
+                                self.columns.append(var)
+                        terms[var] += sign * (1.0 if coeff is None else coeff)
+                        sign, coeff = 1.0, None
+                    after_var = True
+                    continue
+                
+                if kind == 'sign':
+                    op = -1.0 if token == '-' else 1.0
+                    # Signs in a row combine ('- -2 x'); after a dangling constant a new term starts
+                    sign = op if coeff is not None else sign * op
+                    coeff, skip_next = None, False
+                elif kind == 'number':
+                    if skip_next:
+                        skip_next = False  # Exponent
+                    else:
+                        coeff = float(token)
+                elif token == '*':
+                    skip_next = after_var  # Another factor follows a variable
+                elif token == '^':
+                    skip_next = True  # Exponent follows
+                elif kind == 'rel':
+                    sign, coeff, skip_next = 1.0, None, False
+                elif kind == 'bad':
+                    raise ValueError(f"unexpected {token!r} in expression {expr.strip()!r}")
+                after_var = False
         
         return terms
     
-    def _parse_coefficient(self, coeff_str: str) -> float:
-        """Parse coefficient string"""
-        coeff_str = coeff_str.replace(' ', '').strip()
-        
-        if not coeff_str or coeff_str == '+':
-            return 1.0
-        elif coeff_str == '-':
-            return -1.0
-        else:
-            try:
-                return float(coeff_str)
-            except ValueError:
-                return 1.0
-    
     def _parse_bounds(self, bounds_text: str) -> Dict[str, Tuple[float, float]]:
         """Parse variable bounds (simplified)"""
         return {}  # Skip bounds for now to avoid complexity
     
+    def _format_terms(self, terms: List[Tuple[str, float]]) -> str:
+        """Format (var, coeff) terms on one line as 'a x + y - b z', skipping zero coefficients"""
+        # Budget and sector rows are all unit coefficients: plain join, no per-term formatting
+        unit_vars = [var for var, coeff in terms if coeff == 1]
+        if len(unit_vars) == len(terms):
+            return " + ".join(unit_vars)
+        
+        line = "".join([
+            (' - ' if coeff < 0 else ' + ') + (var if coeff == 1 or coeff == -1 else f"{abs(coeff)} {var}")
+            for var, coeff in terms if coeff
+        ])
+        
+        # The first term has no spaces around its sign and no '+'
+        return '-' + line[3:] if line.startswith(' - ') else line[3:]
+    
     def _write_vqe_format(self, output_file: str):
         """Write VQE-compatible format"""
-        with open(output_file, 'w') as f:
-            # Write objective
-            if self.objective_terms:
-                f.write("minimize\n")
-                f.write("obj: ")
-                
-                terms = []
-                for var, coeff in self.objective_terms.items():
-                    if coeff != 0:
-                        if len(terms) == 0:
-                            sign = '' if coeff >= 0 else '-'
-                        else:
-                            sign = ' + ' if coeff >= 0 else ' - '
-                            coeff = abs(coeff)
-                        
-                        if coeff == 1:
-                            terms.append(f"{sign}{var}")
-                        else:
-                            terms.append(f"{sign}{coeff} {var}")
-                
-                f.write("".join(terms))
-                f.write("\n\n")
+        # Build the whole file in memory and write it in one call
+        buf = io.StringIO()
+        
+        # Write objective
+        if self.objective_terms:
+            buf.write("minimize\nobj: ")
+            buf.write(self._format_terms(list(self.objective_terms.items())))
+            buf.write("\n\n")
+        
+        # Write constraints (SINGLE LINES!)
+        if self.constraint_names:
+            buf.write("subject to\n")
             
-            # Write constraints (SINGLE LINES!)
-            if self.constraints:
-                f.write("subject to\n")
+            columns, row_ptr, col_idx, coef = self.columns, self.row_ptr, self.col_idx, self.coef
+            for k, name in enumerate(self.constraint_names):
+                start, stop = row_ptr[k], row_ptr[k + 1]
+                terms = list(zip([columns[j] for j in col_idx[start:stop]], coef[start:stop]))
                 
-                for constraint in self.constraints:
-                    name = constraint['name']
-                    terms = constraint['terms']
-                    sense = constraint['sense']
-                    rhs = constraint['rhs']
-                    
-                    # Build constraint on ONE line
-                    term_parts = []
-                    for var, coeff in terms.items():
-                        if coeff != 0:
-                            if len(term_parts) == 0:
-                                sign = '' if coeff >= 0 else '-'
-                            else:
-                                sign = ' + ' if coeff >= 0 else ' - '
-                                coeff = abs(coeff)
-                            
-                            if coeff == 1:
-                                term_parts.append(f"{sign}{var}")
-                            else:
-                                term_parts.append(f"{sign}{coeff} {var}")
-                    
-                    constraint_line = f"{name}: {''.join(term_parts)} {sense} {rhs}"
-                    f.write(constraint_line + "\n")
-                
-                f.write("\n")
+                # Build constraint on ONE line
+                buf.write(name)
+                buf.write(": ")
+                buf.write(self._format_terms(terms))
+                buf.write(f" {self.constraint_senses[k]} {self.constraint_rhs[k]}\n")
             
-            # Write end
-            f.write("end\n")
+            buf.write("\n")
+        
+        # Write end
+        buf.write("end\n")
+        
+        with open(output_file, 'w') as f:
+            f.write(buf.getvalue())
+
+
+def _convert_file(input_file: str) -> str:
+    """Convert one file with a fresh converter (worker entry point)"""
+    return LPFormatConverter().convert_file(input_file)
+
+
+def convert_batch(input_files: List[str], max_workers: int = None) -> List[str]:
+    """Convert several LP files in parallel worker processes, returning the output files"""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_convert_file, input_files))
 
 
 def main():
     """Quick command line interface"""
     if len(sys.argv) < 2:
-        print("Usage: python lp_format_converter.py <input_file.lp>")
+        print("Usage: python lp_format_converter.py <input_file.lp | directory | glob>")
         return
     
     input_file = sys.argv[1]
     
+    # Batch mode: every .lp file in a directory, or every file matching a glob
+    if os.path.isdir(input_file) or any(char in input_file for char in '*?['):
+        pattern = os.path.join(input_file, '*.lp') if os.path.isdir(input_file) else input_file
+        input_files = sorted(glob.glob(pattern))
+        
+        if not input_files:
+            print(f"❌ Error: No LP files match '{input_file}'")
+            return
+        
+        # Outputs are named after the input stem only, so inputs sharing a stem
+        # would overwrite each other's output in whichever order the workers finish
+        sources_by_stem = defaultdict(list)
+        for source_file in input_files:
+            sources_by_stem[Path(source_file).stem].append(source_file)
+        duplicates = {stem: sources for stem, sources in sources_by_stem.items() if len(sources) > 1}
+        if duplicates:
+            print(f"❌ Error: {len(duplicates)} output name(s) would be written by more than one input")
+            for stem, sources in duplicates.items():
+                print(f"  {stem}_converted.lp <- {', '.join(sources)}")
+            return
+        
+        try:
+            result_files = convert_batch(input_files)
+            
+            print(f"\n🎉 SUCCESS! Converted {len(result_files)} files")
+            for source_file, result_file in zip(input_files, result_files):
+                print(f"📁 {source_file} -> {result_file}")
+        
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+        return
+    
     if not os.path.exists(input_file):
         print(f"❌ Error: Input file '{input_file}' not found")
         return
@@ -371,7 +580,7 @@ def main():
         print(f"📁 Input: {input_file}")
         print(f"📁 Output: {result_file}")
         print(f"📊 Variables: {len(converter.variables)}")
-        print(f"📋 Constraints: {len(converter.constraints)}")
+        print(f"📋 Constraints: {len(converter.constraint_names)}")
         
         # Quick verification
         if os.path.exists(result_file):
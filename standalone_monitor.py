@@ -11,39 +11,147 @@ the configuration section below.
 """
 
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.axes import Axes
+from matplotlib.collections import PolyCollection
+import matplotlib.axis as maxis
+from matplotlib.projections import register_projection
 import numpy as np
-import pandas as pd
 import pickle as pkl
 from pathlib import Path
 import time
 import sys
 import os
+import queue
+import threading
+from collections import ChainMap, defaultdict
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style
+# Set style (the seaborn look ships with matplotlib; the palette is seaborn's 6-color "husl")
 plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+plt.rcParams['axes.prop_cycle'] = plt.cycler(color=['#f77189', '#bb9832', '#50b131',
+                                                    '#36ada4', '#3ba3ec', '#e866f4'])
+
+class ThinAxes(Axes):
+    """
+    Axes for text-only panels: no spines, and the axis stays off
+
+    Skipping the spines (and the tick machinery, which is never drawn
+    with the axis off) makes the panel cheaper to build and redraw.
+    """
+    name = 'thin'
+    
+    def _gen_axes_spines(self, locations=None, offset=0.0, units='inches'):
+        return {}
+    
+    def _init_axis(self):
+        # Same as Axes, minus registering the (absent) spines
+        self.xaxis = maxis.XAxis(self, clear=False)
+        self.yaxis = maxis.YAxis(self, clear=False)
+
+    # Ticks normally hang off the spines; without them, use the grid transforms
+    def get_xaxis_transform(self, which='grid'):
+        return self._xaxis_transform
+
+    def get_yaxis_transform(self, which='grid'):
+        return self._yaxis_transform
+
+    def clear(self):
+        super().clear()
+        self.set_axis_off()
+
+register_projection(ThinAxes)
 
 class VQEPortfolioMonitor:
-    def __init__(self, data_path, experiment_id='test'):
+    # Experiment fields each panel's plot_<panel> method reads
+    PANEL_DEPS = {
+        'convergence': {'step3_monitor_iter_best_fx', 'refvalue'},
+        'parameter_updates': {'step3_monitor_iter_thetas'},
+        'solution_quality': {'refvalue', 'step3_result_best_fx'},
+        'iteration_performance': {'step3_iter_fx_evals'},
+        'parameter_distribution': {'step3_monitor_iter_thetas'},
+        'constraint_info': {'experiment_id', 'ansatz', 'device', 'alpha', 'shots', 'step3_time',
+                            'step3_result_message', 'step3_fx_evals'},
+    }
+    
+    # Info panel text, filled from the experiment dict ('_runtime' is preformatted)
+    INFO_TEMPLATE = """
+Experiment: {experiment_id}
+Ansatz: {ansatz}
+Device: {device}
+Alpha (CVaR): {alpha}
+Shots: {shots}
+Runtime: {_runtime}
+Status: {step3_result_message}
+Function Evals: {step3_fx_evals}
+ """
+    INFO_DEFAULTS = {'step3_result_message': 'Running...'}
+    
+    # Seconds between checks of the experiment files for changes
+    WATCH_INTERVAL = 0.5
+    
+    # Arrays in the optional companion files (exp0.npz, or exp0_<key>.npy), and the
+    # experiment fields they fill
+    ARRAY_FIELDS = {
+        'thetas': 'step3_monitor_iter_thetas',
+        'best_fx': 'step3_monitor_iter_best_fx',
+    }
+    
+    def __init__(self, data_path, experiment_id='test', debug=False):
         """
         Monitor VQE portfolio optimization in real-time
         
         Args:
             data_path: Path to the data directory
             experiment_id: The experiment ID to monitor
+            debug: Dump the experiment data on every update
         """
         self.data_path = Path(data_path)
         self.experiment_id = experiment_id
+        self.debug = debug
         self.fig = None
         self.axes = None
         
+        # Blitting state: artists redrawn on every update, the figure background
+        # they are painted over, and whether the background has gone stale
+        self._animated = []
+        self._background = None
+        self._full_redraw = True
+        
+        # Last experiment data loaded, keyed by path and the pickle/companion (mtime, size)
+        self._cache_stamp = None
+        self._cached_data = None
+        
+        # Experiment file the data was last loaded from
+        self._resolved_exp_file = None
+        
+        # Convergence series buffers, how many iterations they hold, and the
+        # improvement indices and value range found so far
+        self._conv_x = np.empty(0, dtype=int)
+        self._conv_y = np.empty(0)
+        self._last_n = 0
+        self._improvements = np.empty(0, dtype=int)
+        self._conv_range = (np.inf, -np.inf)
+        
+        # Parameter-change norms computed so far, and how many thetas they cover
+        self._param_changes = np.empty(0, dtype=np.float32)
+        self._theta_count = 0
+        self._last_theta = None
+        
+        # Experiment dict the panels were last plotted from
+        self._plotted_data = None
+        
     def setup_plots(self):
         """Setup the monitoring dashboard"""
-        self.fig, self.axes = plt.subplots(2, 3, figsize=(18, 12))
+        # Built cell by cell so the text-only info panel can use the thin projection
+        # Constrained layout is solved during full draws only, never on a blitted update
+        self.fig = plt.figure(figsize=(18, 12), layout='constrained')
+        grid = self.fig.add_gridspec(2, 3)
+        self.axes = np.empty((2, 3), dtype=object)
+        for i, j in np.ndindex(self.axes.shape):
+            projection = 'thin' if (i, j) == (1, 2) else None
+            self.axes[i, j] = self.fig.add_subplot(grid[i, j], projection=projection)
         self.fig.suptitle(f'VQE Portfolio Optimization Monitor: {self.experiment_id}', fontsize=16)
         
         # Configure subplots
@@ -53,16 +161,150 @@ class VQEPortfolioMonitor:
             'Solution Quality vs Classical',
             'Iteration Performance',
             'Parameter Distribution',
-            'Constraint Violations'
+            'Optimization Info'
         ]
         
         for i, ax in enumerate(self.axes.flat):
             ax.set_title(titles[i])
             ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        # Persistent artists for the line and bar panels, updated in place and blitted
+        ax = self.axes[0, 0]
+        self._conv_line, = ax.plot([], [], 'b-', linewidth=2, label='Best Objective')
+        self._ref_line = ax.axhline(y=0, color='r', linestyle='--', visible=False)
+        self._improve_scatter = ax.scatter([], [], color='green', s=50, zorder=5, label='Improvements')
+        self._conv_message = ax.text(0.5, 0.5, '', transform=ax.transAxes, ha='center', va='center')
+        self._conv_legend_label = None
+        ax.set_xlabel('Iteration')
+        ax.set_ylabel('Objective Value')
+        
+        ax = self.axes[0, 1]
+        self._param_line, = ax.plot([], [], 'g-', linewidth=2, label='Parameter Change Magnitude')
+        self._param_message = ax.text(0.5, 0.5, '', transform=ax.transAxes, ha='center', va='center')
+        ax.set_xlabel('Iteration')
+        ax.set_ylabel('||Δθ||')
+        ax.set_yscale('log')
+        self._param_legend = ax.legend(loc='upper right')
+        self._param_legend.set_visible(False)
+        
+        ax = self.axes[0, 2]
+        self._quality_bars = ax.bar([0, 1], [0, 0], color=['red', 'blue'], alpha=0.7,
+                                    tick_label=['Classical\nSolution', 'Quantum\nSolution'])
+        self._quality_labels = [ax.text(i, 0, '', ha='center', va='bottom') for i in (0, 1)]
+        self._gap_text = ax.text(0.5, 0.95, '', transform=ax.transAxes, ha='center', va='top',
+                                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        self._quality_values = None
+        ax.set_ylabel('Objective Value')
+        
+        ax = self.axes[1, 0]
+        self._iter_bars = ax.add_collection(PolyCollection([], facecolor='orange', alpha=0.7,
+                                                           label='Function Evaluations'))
+        self._iter_legend = ax.legend(handles=[self._iter_bars])
+        self._iter_legend.set_visible(False)
+        self._iter_extent = (0, 0)
+        ax.set_xlim(-1, 10)
+        ax.set_ylim(0, 1)
+        ax.set_xlabel('Iteration')
+        ax.set_ylabel('Function Evaluations')
+        
+        # Histogram bins are fixed (from the usual range of rotation angles) and the bars reused
+        ax = self.axes[1, 1]
+        self._hist_edges = np.linspace(-np.pi, np.pi, 21)
+        self._hist_bars = ax.bar(self._hist_edges[:-1], np.zeros(20), width=np.diff(self._hist_edges),
+                                 align='edge', alpha=0.7, color='purple', edgecolor='black')
+        self._mean_line = ax.axvline(0, color='red', linestyle='--', label='Mean')
+        self._hist_legend = ax.legend(handles=[self._mean_line])
+        self._hist_message = ax.text(0.5, 0.5, '', transform=ax.transAxes, ha='center', va='center')
+        ax.set_xlabel('Parameter Value')
+        ax.set_ylabel('Frequency')
+        
+        # The info panel shows one of two persistent texts
+        ax = self.axes[1, 2]
+        self._info_text = ax.text(0.05, 0.95, '', transform=ax.transAxes, verticalalignment='top',
+                                  fontfamily='monospace', visible=False,
+                                  bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+        self._waiting_text = ax.text(0.5, 0.5, 'Waiting for experiment data...\nMake sure VQE is running!',
+                                     transform=ax.transAxes, ha='center', va='center', fontsize=14,
+                                     visible=False, bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.8))
+        
+        # Nothing is plotted on the new figure yet, so every panel is dirty
+        self._plotted_data = None
+        
+        self._animated = [self._conv_line, self._ref_line, self._improve_scatter, self._conv_message,
+                          self._param_line, self._param_message,
+                          *self._quality_bars, *self._quality_labels, self._gap_text,
+                          self._iter_bars, *self._hist_bars, self._mean_line, self._hist_legend, self._hist_message,
+                          self._info_text, self._waiting_text]
+        
+        # Backends without blitting fall back to full redraws of ordinary artists
+        self._set_animated(self.fig.canvas.supports_blit)
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        
         return self.fig, self.axes
     
+    def _set_animated(self, animated):
+        """Toggle blitting for the persistent artists (animated artists are skipped by savefig)"""
+        for artist in self._animated:
+            artist.set_animated(animated)
+        self._background = None
+    
+    def _on_draw(self, event):
+        """After a full draw, keep the background and paint the animated artists over it"""
+        if event is not None and event.canvas is not self.fig.canvas:
+            return
+        if self._animated and self._animated[0].get_animated():
+            self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+            self._draw_animated()
+    
+    def _draw_animated(self):
+        """Draw every animated artist onto the canvas"""
+        for artist in self._animated:
+            self.fig.draw_artist(artist)
+    
+    def _redraw(self):
+        """Blit the animated artists, or redraw everything when the background is stale"""
+        canvas = self.fig.canvas
+        if self._full_redraw or self._background is None:
+            canvas.draw()  # Fires draw_event, which refreshes the background
+        else:
+            canvas.restore_region(self._background)
+            self._draw_animated()
+        canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+        self._full_redraw = False
+    
+    def _set_static_visible(self, artist, visible):
+        """Show or hide a non-animated artist, scheduling a full redraw if that changes anything"""
+        if artist.get_visible() != visible:
+            artist.set_visible(visible)
+            self._full_redraw = True
+    
+    def _fit_limits(self, ax, x_max, y_min, y_max):
+        """
+        Grow the axes limits to fit the data
+        
+        Limits only grow, with headroom, so most updates keep them and can
+        be blitted; a change schedules a full redraw.
+        """
+        x_lo, x_hi = ax.get_xlim()
+        y_lo, y_hi = ax.get_ylim()
+        fitted = getattr(ax, '_monitor_fitted', False)
+        if fitted and x_max <= x_hi and y_lo <= y_min and y_max <= y_hi:
+            return
+        
+        if ax.get_yscale() == 'log':
+            new_y_lo, new_y_hi = y_min / 2, y_max * 2
+        else:
+            pad = 0.1 * (y_max - y_min) or 0.1 * abs(y_max) or 1.0
+            new_y_lo, new_y_hi = y_min - pad, y_max + pad
+        if fitted:
+            new_y_lo, new_y_hi = min(y_lo, new_y_lo), max(y_hi, new_y_hi)
+        
+        ax.set_xlim(0, max(x_max * 1.5, 10))
+        ax.set_ylim(new_y_lo, new_y_hi)
+        ax._monitor_fitted = True
+        self._full_redraw = True
+    
     def load_iteration_data(self, iter_num):
         """Load data from a specific iteration pickle file"""
         iter_file = self.data_path / f'1/31bonds/{self.experiment_id}_{iter_num}.pkl'
@@ -75,39 +317,111 @@ class VQEPortfolioMonitor:
                 return None
         return None
     
-    def load_experiment_data(self):
-        """Load the main experiment results"""
-        # Try different possible locations for the experiment file
-        possible_paths = [
+    def _file_stamps(self, exp_file):
+        """
+        (mtime, size) of the experiment pickle and of each companion file (None where missing)
+        
+        One directory scan finds which of them exist, so only those are
+        stat'ed, instead of a stat per candidate name.
+        """
+        names = [exp_file.name] + [f.name for f in self._companion_files(exp_file)]
+        found = {}
+        try:
+            with os.scandir(exp_file.parent) as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        st = entry.stat()
+                        found[entry.name] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+        return [found.get(name) for name in names]
+    
+    def _companion_files(self, exp_file):
+        """Optional array files next to the experiment pickle: the .npz archive, then one .npy per array"""
+        return [exp_file.with_suffix('.npz')] + [exp_file.with_name(f'{exp_file.stem}_{key}.npy')
+                                                 for key in self.ARRAY_FIELDS]
+    
+    def _load_array_companions(self, exp_file, data):
+        """
+        Overlay the numeric arrays from the companion files onto the experiment dict
+        
+        Plain arrays load without unpickling each element; the pickle keeps
+        the metadata and remains the fallback for older runs. A .npy file
+        wins over the .npz and is memory-mapped, so only the pages the
+        panels touch are read (writers should replace it atomically, not
+        rewrite it in place).
+        """
+        npz_file, *npy_files = self._companion_files(exp_file)
+        if npz_file.exists():
+            try:
+                with np.load(npz_file, allow_pickle=False) as arrays:
+                    for key, field in self.ARRAY_FIELDS.items():
+                        if key in arrays:
+                            data[field] = arrays[key]
+            except Exception as e:
+                print(f"⚠️  Ignoring {npz_file}: {e}")
+        
+        for npy_file, field in zip(npy_files, self.ARRAY_FIELDS.values()):
+            if npy_file.exists():
+                try:
+                    data[field] = np.load(npy_file, mmap_mode='r', allow_pickle=False)
+                except Exception as e:
+                    print(f"⚠️  Ignoring {npy_file}: {e}")
+    
+    def _experiment_paths(self):
+        """Possible locations of the experiment file"""
+        return [
             self.data_path / f'1/31bonds/{self.experiment_id}/exp0.pkl',
             self.data_path / f'31bonds/{self.experiment_id}/exp0.pkl',
             self.data_path / f'{self.experiment_id}/exp0.pkl',
         ]
+    
+    def load_experiment_data(self):
+        """Load the main experiment results"""
+        possible_paths = self._experiment_paths()
         
-        for exp_file in possible_paths:
-            if exp_file.exists():
-                try:
-                    print(f"📂 Loading data from: {exp_file}")
-                    with open(exp_file, 'rb') as f:
-                        data = pkl.load(f)
-                    
-                    # Debug: Check what we actually loaded
-                    if data is None:
-                        print("⚠️  Loaded data is None - file might be incomplete")
-                        continue
-                    elif isinstance(data, dict):
-                        print(f"✅ Loaded dictionary with {len(data)} keys")
-                        if len(data) == 0:
-                            print("⚠️  Dictionary is empty - experiment might still be running")
-                            continue
-                        return data
-                    else:
-                        print(f"⚠️  Loaded data type: {type(data)} - expected dictionary")
+        # Try where the data was last found first, so a steady poll scans one directory
+        candidates = possible_paths
+        if self._resolved_exp_file is not None:
+            candidates = [self._resolved_exp_file] + [p for p in possible_paths if p != self._resolved_exp_file]
+        
+        for exp_file in candidates:
+            file_stamp, *companion_stamps = self._file_stamps(exp_file)
+            if file_stamp is None:
+                continue
+            
+            # Unchanged since the last poll: skip the unpickle entirely
+            companion_stamps = tuple(companion_stamps)
+            stamp = (exp_file, file_stamp, companion_stamps)
+            if stamp == self._cache_stamp:
+                return self._cached_data
+            
+            try:
+                print(f"📂 Loading data from: {exp_file}")
+                # One read of the whole file, then unpickle from memory
+                data = pkl.loads(exp_file.read_bytes())
+                
+                # Debug: Check what we actually loaded
+                if data is None:
+                    print("⚠️  Loaded data is None - file might be incomplete")
+                    continue
+                elif isinstance(data, dict):
+                    print(f"✅ Loaded dictionary with {len(data)} keys")
+                    if len(data) == 0:
+                        print("⚠️  Dictionary is empty - experiment might still be running")
                         continue
-                        
-                except Exception as e:
-                    print(f"❌ Error loading from {exp_file}: {e}")
+                    if any(companion_stamps):
+                        self._load_array_companions(exp_file, data)
+                    self._cache_stamp, self._cached_data = stamp, data
+                    self._resolved_exp_file = exp_file
+                    return data
+                else:
+                    print(f"⚠️  Loaded data type: {type(data)} - expected dictionary")
                     continue
+                    
+            except Exception as e:
+                print(f"❌ Error loading from {exp_file}: {e}")
+                continue
         
         # If no files found, show what we're looking for
         print("🔍 No valid experiment data found. Searched in:")
@@ -119,167 +433,280 @@ class VQEPortfolioMonitor:
     def plot_convergence(self, exp_data):
         """Plot objective function convergence"""
         ax = self.axes[0, 0]
-        ax.clear()
-        ax.set_title('Objective Function Convergence')
         
+        message = ''
         if exp_data and 'step3_monitor_iter_best_fx' in exp_data:
             best_fx = exp_data['step3_monitor_iter_best_fx']
             
             # Debug: Check if best_fx is None or empty
             if best_fx is None:
-                ax.text(0.5, 0.5, 'No convergence data yet\n(best_fx is None)', 
-                       transform=ax.transAxes, ha='center', va='center')
-                return
+                message = 'No convergence data yet\n(best_fx is None)'
             elif len(best_fx) == 0:
-                ax.text(0.5, 0.5, 'No convergence data yet\n(best_fx is empty)', 
-                       transform=ax.transAxes, ha='center', va='center')
-                return
-            
-            iterations = range(len(best_fx))
-            
-            ax.plot(iterations, best_fx, 'b-', linewidth=2, label='Best Objective')
-            
-            refvalue = exp_data.get('refvalue')
-            if refvalue is not None:
-                ax.axhline(y=refvalue, color='r', linestyle='--', 
-                          label=f'Classical Solution: {refvalue:.4f}')
-            
-            ax.set_xlabel('Iteration')
-            ax.set_ylabel('Objective Value')
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            
-            # Add improvement indicators
-            if len(best_fx) > 1:
-                improvements = [i for i in range(1, len(best_fx)) if best_fx[i] < best_fx[i-1]]
-                if improvements:
-                    ax.scatter([improvements], [best_fx[i] for i in improvements], 
-                             color='green', s=50, zorder=5, label='Improvements')
+                message = 'No convergence data yet\n(best_fx is empty)'
         else:
-            ax.text(0.5, 0.5, 'Waiting for convergence data...\nstep3_monitor_iter_best_fx not found', 
-                   transform=ax.transAxes, ha='center', va='center')
+            message = 'Waiting for convergence data...\nstep3_monitor_iter_best_fx not found'
+        
+        self._conv_message.set_text(message)
+        if message:
+            self._conv_line.set_visible(False)
+            self._ref_line.set_visible(False)
+            self._improve_scatter.set_visible(False)
+            if ax.get_legend() is not None:
+                self._set_static_visible(ax.get_legend(), False)
+            return
+        
+        n = self._update_convergence_series(best_fx)
+        self._conv_line.set_data(self._conv_x[:n], self._conv_y[:n])
+        self._conv_line.set_visible(True)
+        y_min, y_max = self._conv_range
+        
+        refvalue = exp_data.get('refvalue')
+        if refvalue is not None:
+            self._ref_line.set_ydata([refvalue, refvalue])
+            self._ref_line.set_visible(True)
+            y_min, y_max = min(y_min, refvalue), max(y_max, refvalue)
+            legend_label = f'Classical Solution: {refvalue:.4f}'
+        else:
+            self._ref_line.set_visible(False)
+            legend_label = ''
+        
+        # The legend is static: rebuild it only when the reference label changes
+        if legend_label != self._conv_legend_label or ax.get_legend() is None:
+            self._ref_line.set_label(legend_label or '_nolegend_')
+            handles = [self._conv_line] + ([self._ref_line] if legend_label else [])
+            ax.legend(handles=handles)
+            self._conv_legend_label = legend_label
+            self._full_redraw = True
+        self._set_static_visible(ax.get_legend(), True)
+        
+        self._fit_limits(ax, n - 1, y_min, y_max)
+        
+        # Add improvement indicators
+        improvements = self._improvements
+        self._improve_scatter.set_offsets(np.c_[improvements, self._conv_y[improvements]])
+        self._improve_scatter.set_visible(len(improvements) > 0)
+    
+    def _update_convergence_series(self, best_fx):
+        """
+        Append the iterations added since the last poll to the convergence buffers
+        
+        Only the new tail of best_fx is converted and scanned for improvements;
+        if the history got shorter or its last seen value changed, the
+        buffers are rebuilt. Returns the number of iterations held.
+        """
+        n, last_n = len(best_fx), self._last_n
+        if last_n and (n < last_n or float(np.ravel(best_fx[last_n - 1])[0]) != self._conv_y[last_n - 1]):
+            last_n = 0
+        if last_n == 0:
+            self._improvements = np.empty(0, dtype=int)
+            self._conv_range = (np.inf, -np.inf)
+        if n == last_n:
+            return n
+        
+        # Grow the buffers geometrically so appends stay amortised O(1)
+        if n > len(self._conv_y):
+            capacity = max(n, 2 * len(self._conv_y), 64)
+            self._conv_y = np.resize(self._conv_y, capacity)
+            self._conv_x = np.arange(capacity)
+        
+        new = np.asarray(best_fx[last_n:], dtype=float).reshape(n - last_n)
+        self._conv_y[last_n:n] = new
+        self._conv_range = (min(self._conv_range[0], new.min()), max(self._conv_range[1], new.max()))
+        
+        # Improvements in the tail, including the step from the last seen value
+        start = max(last_n - 1, 0)
+        drops = np.flatnonzero(np.diff(self._conv_y[start:n]) < 0) + start + 1
+        self._improvements = np.concatenate((self._improvements, drops))
+        self._last_n = n
+        return n
+    
+    def _update_param_changes(self, thetas):
+        """
+        ||Δθ|| between consecutive iterations, extended with only the new iterations
+        
+        Norms are cached as float32 (plenty for display); if the history got
+        shorter or its last cached theta changed, it is a new run and
+        everything is recomputed.
+        """
+        start = 0
+        if 0 < self._theta_count <= len(thetas):
+            last = thetas[self._theta_count - 1]
+            if last is not None and np.array_equal(np.asarray(last, dtype=np.float32), self._last_theta):
+                start = self._theta_count - 1
+        if start == 0:
+            self._param_changes = np.empty(0, dtype=np.float32)
+        
+        # Arrays (e.g. a memory-mapped .npy) need no None filtering and, as float32, no copy
+        if isinstance(thetas, np.ndarray):
+            tail = thetas[start:]
+        else:
+            tail = [t for t in thetas[start:] if t is not None]
+        if len(tail) > 1:
+            tail = np.asarray(tail, dtype=np.float32)
+            changes = np.linalg.norm(np.diff(tail, axis=0), axis=1)
+            self._param_changes = np.concatenate((self._param_changes, changes))
+        if len(tail):
+            self._last_theta = np.asarray(tail[-1], dtype=np.float32)
+        self._theta_count = len(thetas)
+        return self._param_changes
     
     def plot_parameter_updates(self, exp_data):
         """Plot parameter update magnitudes"""
         ax = self.axes[0, 1]
-        ax.clear()
-        ax.set_title('Parameter Updates (θ)')
         
+        message = ''
         if exp_data and 'step3_monitor_iter_thetas' in exp_data:
             thetas = exp_data['step3_monitor_iter_thetas']
             
             # Debug: Check if thetas is None or empty
             if thetas is None:
-                ax.text(0.5, 0.5, 'No parameter data yet\n(thetas is None)', 
-                       transform=ax.transAxes, ha='center', va='center')
-                return
+                message = 'No parameter data yet\n(thetas is None)'
             elif len(thetas) <= 1:
-                ax.text(0.5, 0.5, 'Need more iterations\nfor parameter tracking', 
-                       transform=ax.transAxes, ha='center', va='center')
-                return
-            
-            # Calculate parameter changes between iterations
-            param_changes = []
-            for i in range(1, len(thetas)):
-                if thetas[i] is not None and thetas[i-1] is not None:
-                    change = np.linalg.norm(np.array(thetas[i]) - np.array(thetas[i-1]))
-                    param_changes.append(change)
-            
-            if param_changes:
-                iterations = range(1, len(param_changes) + 1)
-                ax.plot(iterations, param_changes, 'g-', linewidth=2, label='Parameter Change Magnitude')
-                ax.set_xlabel('Iteration')
-                ax.set_ylabel('||Δθ||')
-                ax.legend()
-                ax.set_yscale('log')
+                message = 'Need more iterations\nfor parameter tracking'
             else:
-                ax.text(0.5, 0.5, 'No valid parameter changes found', 
-                       transform=ax.transAxes, ha='center', va='center')
+                param_changes = self._update_param_changes(thetas)
+                if len(param_changes) == 0:
+                    message = 'No valid parameter changes found'
         else:
-            ax.text(0.5, 0.5, 'Waiting for parameter data...\nstep3_monitor_iter_thetas not found', 
-                   transform=ax.transAxes, ha='center', va='center')
+            message = 'Waiting for parameter data...\nstep3_monitor_iter_thetas not found'
+        
+        self._param_message.set_text(message)
+        self._param_line.set_visible(not message)
+        self._set_static_visible(self._param_legend, not message)
+        if message:
+            return
+        
+        self._param_line.set_data(np.arange(1, len(param_changes) + 1), param_changes)
+        
+        # Zero changes cannot be shown on the log scale
+        positive = param_changes[param_changes > 0]
+        if len(positive):
+            self._fit_limits(ax, len(param_changes), positive.min(), positive.max())
     
     def plot_solution_quality(self, exp_data):
         """Plot solution quality metrics"""
         ax = self.axes[0, 2]
-        ax.clear()
-        ax.set_title('Solution Quality vs Classical')
         
+        values = None
         if exp_data:
             classical_val = exp_data.get('refvalue', 0)
             quantum_val = exp_data.get('step3_result_best_fx', 0)
-            
             if classical_val != 0:
-                rel_gap = (quantum_val - classical_val) / abs(classical_val) * 100
-                
-                categories = ['Classical\nSolution', 'Quantum\nSolution']
-                values = [classical_val, quantum_val]
-                colors = ['red', 'blue']
-                
-                bars = ax.bar(categories, values, color=colors, alpha=0.7)
-                ax.set_ylabel('Objective Value')
-                
-                # Add value labels on bars
-                for bar, val in zip(bars, values):
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'{val:.4f}', ha='center', va='bottom')
-                
-                # Add gap information
-                ax.text(0.5, 0.95, f'Relative Gap: {rel_gap:.2f}%', 
-                       transform=ax.transAxes, ha='center', va='top',
-                       bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+                values = (classical_val, quantum_val)
+        
+        for artist in (*self._quality_bars, *self._quality_labels, self._gap_text):
+            artist.set_visible(values is not None)
+        if values is None:
+            return
+        
+        classical_val, quantum_val = values
+        rel_gap = (quantum_val - classical_val) / abs(classical_val) * 100
+        
+        # Update bar heights and their value labels in place
+        for bar, label, val in zip(self._quality_bars, self._quality_labels, values):
+            bar.set_height(val)
+            label.set_y(val)
+            label.set_text(f'{val:.4f}')
+        self._gap_text.set_text(f'Relative Gap: {rel_gap:.2f}%')
+        
+        if values != self._quality_values:
+            # Autoscale as ax.bar would: 5% margins, but none past the bars' zero base
+            lo, hi = min(0, *values), max(0, *values)
+            pad = 0.05 * (hi - lo) or 1.0
+            ax.set_ylim(lo - pad if lo < 0 else lo, hi + pad if hi > 0 else hi)
+            self._quality_values = values
+            self._full_redraw = True
     
     def plot_iteration_performance(self, exp_data):
         """Plot iteration-wise performance metrics"""
-        ax = self.axes[1, 0]
-        ax.clear()
-        ax.set_title('Iteration Performance')
-        
+        fx_evals = []
         if exp_data and 'step3_iter_fx_evals' in exp_data:
-            fx_evals = exp_data['step3_iter_fx_evals']
-            iterations = range(len(fx_evals))
-            
-            ax.bar(iterations, fx_evals, alpha=0.7, color='orange', label='Function Evaluations')
-            ax.set_xlabel('Iteration')
-            ax.set_ylabel('Function Evaluations')
-            ax.legend()
+            fx_evals = exp_data['step3_iter_fx_evals'] or []
+        
+        # All bars are one polygon collection, rebuilt from numpy in a single call
+        heights = np.asarray(fx_evals, dtype=float).ravel()
+        left = np.arange(len(heights)) - 0.4
+        verts = np.empty((len(heights), 4, 2))
+        verts[:, :, 0] = np.c_[left, left, left + 0.8, left + 0.8]
+        verts[:, :, 1] = np.c_[np.zeros_like(heights), heights, heights, np.zeros_like(heights)]
+        self._iter_bars.set_verts(verts)
+        self._iter_extent = (len(heights), heights.max(initial=0))
+        self._set_static_visible(self._iter_legend, len(heights) > 0)
+        self._fit_iteration_limits()
+    
+    def _fit_iteration_limits(self, tight=False):
+        """
+        Fit the iteration panel to its bars
+        
+        Live limits only grow, with headroom, so updates can be blitted;
+        tight limits (for the report) match what ax.bar would autoscale to.
+        """
+        ax = self.axes[1, 0]
+        n, top = self._iter_extent
+        if tight:
+            margin = 0.05 * max(n, 1)
+            ax.set_xlim(-0.4 - margin, n - 0.6 + margin)
+            ax.set_ylim(0, top * 1.05 or 1)
+        elif n > ax.get_xlim()[1] or top > ax.get_ylim()[1]:
+            ax.set_xlim(-1, max(n * 1.5, 10))
+            ax.set_ylim(0, max(top * 1.25, ax.get_ylim()[1]))
+            self._full_redraw = True
     
     def plot_parameter_distribution(self, exp_data):
         """Plot current parameter distribution"""
-        ax = self.axes[1, 1]
-        ax.clear()
-        ax.set_title('Parameter Distribution')
-        
+        message = ''
         if exp_data and 'step3_monitor_iter_thetas' in exp_data:
             thetas = exp_data['step3_monitor_iter_thetas']
             
             if thetas is None or len(thetas) == 0:
-                ax.text(0.5, 0.5, 'No parameter data available', 
-                       transform=ax.transAxes, ha='center', va='center')
-                return
-            
-            current_theta = thetas[-1]
-            if current_theta is None:
-                ax.text(0.5, 0.5, 'Latest parameters are None', 
-                       transform=ax.transAxes, ha='center', va='center')
-                return
-            
-            ax.hist(current_theta, bins=20, alpha=0.7, color='purple', edgecolor='black')
-            ax.set_xlabel('Parameter Value')
-            ax.set_ylabel('Frequency')
-            ax.axvline(np.mean(current_theta), color='red', linestyle='--', 
-                      label=f'Mean: {np.mean(current_theta):.3f}')
-            ax.legend()
+                message = 'No parameter data available'
+            elif thetas[-1] is None:
+                message = 'Latest parameters are None'
         else:
-            ax.text(0.5, 0.5, 'Waiting for parameter data...', 
-                   transform=ax.transAxes, ha='center', va='center')
+            message = 'Waiting for parameter data...'
+        
+        self._hist_message.set_text(message)
+        for artist in (*self._hist_bars, self._mean_line, self._hist_legend):
+            artist.set_visible(not message)
+        if message:
+            return
+        
+        current_theta = np.asarray(thetas[-1], dtype=float).ravel()
+        self._fit_hist_edges(current_theta)
+        
+        # Histogram into the fixed edges and update the bar heights in place
+        counts, _ = np.histogram(current_theta, bins=self._hist_edges)
+        for bar, count in zip(self._hist_bars, counts):
+            bar.set_height(count)
+        
+        mean = current_theta.mean()
+        self._mean_line.set_xdata([mean, mean])
+        self._hist_legend.get_texts()[0].set_text(f'Mean: {mean:.3f}')
+        
+        ax = self.axes[1, 1]
+        if counts.max() > ax.get_ylim()[1]:
+            ax.set_ylim(0, counts.max() * 1.25)
+            self._full_redraw = True
+    
+    def _fit_hist_edges(self, values):
+        """Widen the histogram bins if the values fall outside them (rare: angles stay near [-π, π])"""
+        edges = self._hist_edges
+        lo, hi = values.min(), values.max()
+        if edges[0] <= lo and hi <= edges[-1]:
+            return
+        
+        edges = self._hist_edges = np.linspace(min(lo, edges[0]), max(hi, edges[-1]), len(edges))
+        for bar, left, width in zip(self._hist_bars, edges[:-1], np.diff(edges)):
+            bar.set_x(left)
+            bar.set_width(width)
+        margin = 0.05 * (edges[-1] - edges[0])
+        self.axes[1, 1].set_xlim(edges[0] - margin, edges[-1] + margin)
+        self._full_redraw = True
     
     def plot_constraint_info(self, exp_data):
         """Plot constraint-related information"""
-        ax = self.axes[1, 2]
-        ax.clear()
-        ax.set_title('Optimization Info')
+        self._waiting_text.set_visible(False)
+        self._info_text.set_visible(bool(exp_data))
         
         if exp_data:
             runtime = exp_data.get('step3_time', 0)
@@ -287,101 +714,85 @@ class VQEPortfolioMonitor:
                 runtime_str = f"{runtime:.2f}s"
             else:
                 runtime_str = "Running..."
-                
-            info_text = f"""
-Experiment: {exp_data.get('experiment_id', 'N/A')}
-Ansatz: {exp_data.get('ansatz', 'N/A')}
-Device: {exp_data.get('device', 'N/A')}
-Alpha (CVaR): {exp_data.get('alpha', 'N/A')}
-Shots: {exp_data.get('shots', 'N/A')}
-Runtime: {runtime_str}
-Status: {exp_data.get('step3_result_message', 'Running...')}
-Function Evals: {exp_data.get('step3_fx_evals', 'N/A')}
-            """
             
-            ax.text(0.05, 0.95, info_text, transform=ax.transAxes, 
-                   verticalalignment='top', fontfamily='monospace',
-                   bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
+            # Missing fields fall back to the per-field defaults, then to 'N/A'
+            fields = ChainMap({'_runtime': runtime_str}, exp_data, self.INFO_DEFAULTS, defaultdict(lambda: 'N/A'))
+            self._info_text.set_text(self.INFO_TEMPLATE.format_map(fields))
+    
+    @staticmethod
+    def _changed_keys(old, new):
+        """Keys whose values differ between two experiment dicts"""
+        if old is new:
+            return set()
+        
+        changed = set(old.keys() ^ new.keys())
+        for key in old.keys() & new.keys():
+            try:
+                same = np.array_equal(old[key], new[key])
+            except Exception:
+                same = False
+            if not same:
+                changed.add(key)
+        return changed
     
     def debug_data(self, exp_data):
-        """Debug function to see what's in the experiment data"""
-        print("🔍 DEBUG: Examining experiment data...")
-        print(f"Data type: {type(exp_data)}")
+        """Debug function to see what's in the experiment data (only when self.debug is set)"""
+        if not self.debug:
+            return
         
+        # Built up and written once, rather than a print per key
+        lines = ["🔍 DEBUG: Examining experiment data...", f"Data type: {type(exp_data)}"]
         if isinstance(exp_data, dict):
-            print(f"Dictionary keys ({len(exp_data)}):")
+            lines.append(f"Dictionary keys ({len(exp_data)}):")
             for key in sorted(exp_data.keys()):
                 value = exp_data[key]
                 if value is None:
-                    print(f"  {key}: None")
+                    lines.append(f"  {key}: None")
                 elif isinstance(value, list):
-                    print(f"  {key}: list with {len(value)} items")
+                    lines.append(f"  {key}: list with {len(value)} items")
                     if len(value) > 0 and value[0] is None:
-                        print(f"    - First item is None")
+                        lines.append(f"    - First item is None")
                 else:
-                    print(f"  {key}: {type(value)} = {value}")
-        print("🔍 DEBUG: End of data examination")
+                    lines.append(f"  {key}: {type(value)} = {value}")
+        lines.append("🔍 DEBUG: End of data examination")
+        sys.stdout.write('\n'.join(lines) + '\n')
     
-    def update_plots(self):
-        """Update all plots with current data"""
-        exp_data = self.load_experiment_data()
+    def update_plots(self, exp_data=None):
+        """Update all plots with current data (loaded from disk unless given)"""
+        if exp_data is None:
+            exp_data = self.load_experiment_data()
         
         if exp_data:
-            # Add debug info
+            # Dump the data when debugging
             self.debug_data(exp_data)
             
-            try:
-                self.plot_convergence(exp_data)
-            except Exception as e:
-                print(f"❌ Error in plot_convergence: {e}")
-                
-            try:
-                self.plot_parameter_updates(exp_data)
-            except Exception as e:
-                print(f"❌ Error in plot_parameter_updates: {e}")
-                
-            try:
-                self.plot_solution_quality(exp_data)
-            except Exception as e:
-                print(f"❌ Error in plot_solution_quality: {e}")
-                
-            try:
-                self.plot_iteration_performance(exp_data)
-            except Exception as e:
-                print(f"❌ Error in plot_iteration_performance: {e}")
-                
-            try:
-                self.plot_parameter_distribution(exp_data)
-            except Exception as e:
-                print(f"❌ Error in plot_parameter_distribution: {e}")
-                
-            try:
-                self.plot_constraint_info(exp_data)
-            except Exception as e:
-                print(f"❌ Error in plot_constraint_info: {e}")
+            # Replot only the panels whose inputs changed since the last update
+            # (all of them the first time, so missing fields show their messages)
+            replot_all = self._plotted_data is None
+            dirty = set() if replot_all else self._changed_keys(self._plotted_data, exp_data)
+            self._plotted_data = exp_data
+            for panel, deps in self.PANEL_DEPS.items():
+                if replot_all or deps & dirty:
+                    try:
+                        getattr(self, f'plot_{panel}')(exp_data)
+                    except Exception as e:
+                        print(f"❌ Error in plot_{panel}: {e}")
         else:
+            self._plotted_data = None
             # Show waiting message if no data yet
-            self.axes[1, 2].clear()
-            self.axes[1, 2].text(0.5, 0.5, 'Waiting for experiment data...\nMake sure VQE is running!', 
-                               transform=self.axes[1, 2].transAxes, ha='center', va='center',
-                               fontsize=14, bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.8))
-            self.axes[1, 2].set_xlim(0, 1)
-            self.axes[1, 2].set_ylim(0, 1)
-            self.axes[1, 2].axis('off')
-        
-        plt.tight_layout()
-        plt.draw()
-    
-    def monitor_realtime(self, update_interval=5, max_updates=100):
+            self._info_text.set_visible(False)
+            self._waiting_text.set_visible(True)
+        
+        self._redraw()
+    
+    def monitor_realtime(self, update_interval=5, max_updates=100, snapshot_path=None):
         """
         Monitor the optimization in real-time
         
         Args:
-            update_interval: Seconds between updates
+            update_interval: Seconds between status updates (new data is shown as soon as it is written)
             max_updates: Maximum number of updates before stopping
+            snapshot_path: If given, save a quick PNG of the dashboard whenever new data arrives
         """
         self.setup_plots()
         plt.ion()  # Turn on interactive mode
@@ -394,11 +805,27 @@ Function Evals: {exp_data.get('step3_fx_evals', 'N/A')}
         print("="*60)
         
         update_count = 0
+        self.update_plots()
+        if snapshot_path and self._plotted_data is not None:
+            self._save_figure(snapshot_path, quick=True)
+        
+        # Reload off the GUI thread, only when the experiment files change
+        updates, stop = queue.Queue(), threading.Event()
+        watcher = threading.Thread(target=self._watch_experiment, args=(updates, stop), daemon=True)
+        watcher.start()
         
         try:
             while update_count < max_updates:
-                self.update_plots()
-                plt.pause(update_interval)
+                # Apply new data as soon as the watcher delivers it, keeping the GUI responsive.
+                # start_event_loop avoids plt.pause's full redraw, which would wipe the blitted artists
+                deadline = time.monotonic() + update_interval
+                while (remaining := deadline - time.monotonic()) > 0 and plt.get_fignums():
+                    exp_data = self._latest(updates)
+                    if exp_data is not None and exp_data is not self._plotted_data:
+                        self.update_plots(exp_data)
+                        if snapshot_path:
+                            self._save_figure(snapshot_path, quick=True)
+                    self.fig.canvas.start_event_loop(min(remaining, self.WATCH_INTERVAL))
                 update_count += 1
                 
                 # Check if window is still open
@@ -410,10 +837,60 @@ Function Evals: {exp_data.get('step3_fx_evals', 'N/A')}
                 
         except KeyboardInterrupt:
             print("\n⛔ Monitoring stopped by user (Ctrl+C).")
+        finally:
+            stop.set()
         
         plt.ioff()  # Turn off interactive mode
         plt.show()
     
+    def _save_figure(self, path, quick):
+        """
+        Save the dashboard: a quick 150 DPI snapshot, or the full 300 DPI report
+        
+        The full save trims to the tight bounding box, measured once here and
+        passed explicitly, instead of letting savefig lay the figure out again.
+        """
+        # savefig skips animated artists: draw them as ordinary ones while saving
+        blitting = bool(self._animated) and self._animated[0].get_animated()
+        self._set_animated(False)
+        try:
+            if quick:
+                self.fig.savefig(path, dpi=150, facecolor='white')
+            else:
+                bbox = self.fig.get_tightbbox(self.fig.canvas.get_renderer()).padded(0.1)
+                self.fig.savefig(path, dpi=300, bbox_inches=bbox, facecolor='white')
+        finally:
+            self._set_animated(blitting)
+            self._full_redraw = True
+    
+    def _watch_experiment(self, updates, stop):
+        """
+        Watcher thread: stat the experiment files and reload them when they change
+        
+        A stat per file is all an idle poll costs; the unpickle happens here,
+        so it never blocks the GUI, and the loaded dict is queued for it.
+        """
+        last_stamps = None
+        while not stop.is_set():
+            paths = [self._resolved_exp_file] if self._resolved_exp_file else self._experiment_paths()
+            stamps = [self._file_stamps(path) for path in paths]
+            if stamps != last_stamps:
+                last_stamps = stamps
+                exp_data = self.load_experiment_data()
+                if exp_data:
+                    updates.put(exp_data)
+            stop.wait(self.WATCH_INTERVAL)
+    
+    @staticmethod
+    def _latest(updates):
+        """Drain the watcher queue, returning only the newest data (None if there is none)"""
+        exp_data = None
+        while True:
+            try:
+                exp_data = updates.get_nowait()
+            except queue.Empty:
+                return exp_data
+    
     def generate_final_report(self, save_path=None):
         """Generate a final analysis report"""
         exp_data = self.load_experiment_data()
@@ -463,7 +940,13 @@ Function Evals: {exp_data.get('step3_fx_evals', 'N/A')}
         
         if save_path:
             try:
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
+                # Fit the blitted panels tightly, their live limits keep headroom
+                for ax in (self.axes[0, 0], self.axes[0, 1], self.axes[1, 1]):
+                    ax.relim()
+                    ax.autoscale()
+                self._fit_iteration_limits(tight=True)
+                
+                self._save_figure(save_path, quick=False)
                 print(f"💾 Report saved to: {save_path}")
             except Exception as e:
                 print(f"⚠️  Could not save report: {e}")
@@ -509,6 +992,7 @@ def main():
     # Monitoring settings
     UPDATE_INTERVAL = 10  # seconds between updates
     MAX_UPDATES = 100     # maximum updates before auto-stop
+    DEBUG = False         # dump the experiment data on every update
     
     # ================================================
     
@@ -522,14 +1006,10 @@ def main():
         return
     
     # Create monitor
-    monitor = VQEPortfolioMonitor(DATA_PATH, experiment_id=EXPERIMENT_ID)
+    monitor = VQEPortfolioMonitor(DATA_PATH, experiment_id=EXPERIMENT_ID, debug=DEBUG)
     
     # Check if we should do real-time monitoring or final report
-    possible_exp_files = [
-        Path(DATA_PATH) / f'1/31bonds/{EXPERIMENT_ID}/exp0.pkl',
-        Path(DATA_PATH) / f'31bonds/{EXPERIMENT_ID}/exp0.pkl', 
-        Path(DATA_PATH) / f'{EXPERIMENT_ID}/exp0.pkl',
-    ]
+    possible_exp_files = monitor._experiment_paths()
     
     exp_file_found = None
     for exp_file in possible_exp_files:
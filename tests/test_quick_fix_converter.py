@@ -0,0 +1,71 @@
+"""Regression tests for the LP expression parser in quick_fix_converter_2"""
+
+import unittest
+
+from quick_fix_converter_2 import LPFormatConverter
+
+
+def parse(expr):
+    return dict(LPFormatConverter()._parse_linear_expression(expr))
+
+
+class TestParseLinearExpression(unittest.TestCase):
+
+    def test_coefficient_attached_to_name(self):
+        self.assertEqual(parse('2x + 3y'), {'x': 2.0, 'y': 3.0})
+
+    def test_leading_and_inner_minus(self):
+        self.assertEqual(parse('-x - y'), {'x': -1.0, 'y': -1.0})
+
+    def test_no_spaces_around_operator(self):
+        self.assertEqual(parse('x+y'), {'x': 1.0, 'y': 1.0})
+
+    def test_explicit_multiplication(self):
+        self.assertEqual(parse('2.5*x + y'), {'x': 2.5, 'y': 1.0})
+
+    def test_exponent_coefficient(self):
+        self.assertEqual(parse('1e-3 x'), {'x': 1e-3})
+
+    def test_quadratic_section_counts_first_factor(self):
+        self.assertEqual(parse('[ 2 w[0] ^2 + 4 w[0] * w[1] ] / 2 + w[1]'),
+                         {'w_0': 6.0, 'w_1': 1.0})
+
+    def test_only_index_brackets_are_rewritten(self):
+        self.assertEqual(parse('w[0] + x[1][2] + y[a,b]'),
+                         {'w_0': 1.0, 'x_1_2': 1.0, 'y[a,b]': 1.0})
+
+    def test_unexpected_character_raises(self):
+        with self.assertRaises(ValueError):
+            parse('x ; y')
+
+
+class TestSplitSections(unittest.TestCase):
+
+    def split(self, lines):
+        return list(LPFormatConverter()._split_sections(lines))
+
+    def test_variables_named_like_keywords(self):
+        lines = ['Minimize', ' obj: x + min', 'Subject To', ' c1: x', ' min + x >= 1',
+                 ' c2: y', ' end - y >= 0', 'End', ' c3: z']
+        self.assertEqual(self.split(lines), [
+            ('objective', 'obj: x + min'),
+            ('constraints', 'c1: x'),
+            ('constraints', 'min + x >= 1'),
+            ('constraints', 'c2: y'),
+            ('constraints', 'end - y >= 0'),
+        ])
+
+    def test_header_variants(self):
+        lines = ['MINIMIZE \\ comment', ' x', 'subject  to:', ' c1: x >= 1', 'st', ' c2: x <= 2']
+        self.assertEqual(self.split(lines), [
+            ('objective', 'x'),
+            ('constraints', 'c1: x >= 1'),
+            ('constraints', 'c2: x <= 2'),
+        ])
+
+    def test_colon_only_after_constraint_headers(self):
+        self.assertEqual(self.split(['min:', ' x']), [])
+
+
+if __name__ == '__main__':
+    unittest.main()